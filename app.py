@@ -5,11 +5,13 @@ Clean, maintainable, and fully functional Streamlit application
 """
 
 import streamlit as st
+import hashlib
+import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
 # Load environment variables early
 try:
@@ -21,19 +23,21 @@ except ImportError:
 # AI tools library is now installed as a package
 
 # Import our modules
-from config import APP_TITLE, APP_ICON, DEFAULT_TEMPLATE, ERROR_MESSAGES
+from config import APP_TITLE, APP_ICON, DEFAULT_TEMPLATE, ErrorMessage
 from models import FormData, ContentSource
-from services import ImageService, PDFService
-from services.openrouter_ai_service import OpenRouterAIService
+from services.image_service import ImageService
 from components import (
     AppHeader, NavigationSidebar,
     BasicInfoForm, AnalysisForm, TradePlanForm, 
-    ImageUploadForm, TemplateForm,
-    ContentReview, ReportGeneration
+    ImageUploadForm, TemplateForm
 )
-from constants import MAIN_CSS
+from components.navigation import set_current_step
+from constants import get_main_css
 from utils import get_logger
 
+if TYPE_CHECKING:
+    from services.openrouter_ai_service import OpenRouterAIService
+
 # Page configuration
 st.set_page_config(
     page_title=APP_TITLE,
@@ -42,18 +46,43 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Set default theme to light mode
-st.markdown("""
-<style>
-    /* Force light theme */
-    .stApp {
-        color-scheme: light;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Light theme is configured in .streamlit/config.toml ([theme] base = "light")
+
+
+# Apply custom CSS (get_main_css() builds the payload once per process)
+st.markdown(get_main_css(), unsafe_allow_html=True)
+
+# Divider and success box shown at the end of the form section
+_FORM_COMPLETE_HTML = """
+---
+
+<div class="success-box">
+    <h3 style='color: #27ae60; margin: 0 0 8px 0;'>✅ Form Complete</h3>
+    <p style='color: #2e7d32; margin: 0;'>All form data has been collected. Ready to generate content and create your report.</p>
+</div>
+"""
+
+# Content source for each content tab index (0 = Human, 1 = AI)
+_TAB_TO_SOURCE = (ContentSource.HUMAN, ContentSource.AI)
+
+# Content fields mirrored in session state for persistence across navigation
+_PERSISTED_CONTENT_FIELDS = (
+    'human_executive_summary', 'human_investment_rationale',
+    'ai_executive_summary', 'ai_investment_rationale'
+)
+
 
-# Apply custom CSS
-st.markdown(MAIN_CSS, unsafe_allow_html=True)
+@st.cache_resource
+def _ai_service() -> 'OpenRouterAIService':
+    """Get the shared OpenRouter AI service, created once per server process"""
+    from services.openrouter_ai_service import OpenRouterAIService
+    return OpenRouterAIService.get_instance()
+
+
+@st.cache_resource
+def _image_service() -> ImageService:
+    """Get the shared image service, created once per server process"""
+    return ImageService()
 
 
 class InvestmentRecommendationApp:
@@ -69,33 +98,33 @@ class InvestmentRecommendationApp:
         """
         Initialize the application with required services and session state.
         
-        Sets up AI service (singleton), image service, and initializes the session state.
-        PDF service is lazy-loaded to avoid startup errors.
+        Sets up AI service (singleton) and image service. PDF service is lazy-loaded
+        to avoid startup errors. The services themselves are cached resources, so
+        building the app on every run is cheap; session state is initialized in run().
         """
         self.logger = get_logger()
         
         try:
-            # Use singleton pattern for OpenRouter AI service to avoid re-initialization
-            self.ai_service = OpenRouterAIService.get_instance()
-            self.image_service = ImageService()
+            # Services are cached resources to avoid re-initialization on reruns
+            self.ai_service = _ai_service()
+            self.image_service = _image_service()
             # PDF service will be lazy-loaded when needed
             self._pdf_service = None
             
-            # Initialize session state
-            self._initialize_session_state()
-            
             self.logger.info("Application initialized successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize application: {e}", exc_info=True)
             st.error("Application initialization failed. Please refresh the page and try again.")
-            raise
+            # Halt this run cleanly; the failure has already been logged and shown
+            st.stop()
     
     @property
     def pdf_service(self):
         """Lazy-load PDF service to avoid startup errors"""
         if self._pdf_service is None:
             try:
+                from services.pdf_service import PDFService
                 self._pdf_service = PDFService()
                 self.logger.info("PDF service initialized successfully")
             except Exception as e:
@@ -110,7 +139,11 @@ class InvestmentRecommendationApp:
         
         Sets up default values for form data, current step, AI content flags,
         content source, and template version if they don't exist in session state.
+        Runs once per session; the Reset Form action clears the guard flag.
         """
+        if st.session_state.get('session_defaults_initialized'):
+            return
+        
         defaults: Dict[str, Any] = {
             'form_data': None,
             'current_step': 'form',
@@ -121,9 +154,10 @@ class InvestmentRecommendationApp:
             'template_version': DEFAULT_TEMPLATE
         }
         
-        for key, value in defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = value
+        missing = defaults.keys() - set(st.session_state.keys())
+        if missing:
+            st.session_state.update({key: defaults[key] for key in missing})
+        st.session_state.session_defaults_initialized = True
     
     def run(self) -> None:
         """
@@ -132,6 +166,9 @@ class InvestmentRecommendationApp:
         This is the main entry point that renders the header, sidebar,
         and main content based on the current step in the application flow.
         """
+        # Initialize session state (per session, the app instance is shared)
+        self._initialize_session_state()
+        
         # Render header
         AppHeader.render()
         
@@ -162,40 +199,69 @@ class InvestmentRecommendationApp:
         trade_plan = TradePlanForm.render()
         
         # Images
-        images = ImageUploadForm.render()
+        images = ImageUploadForm.render(self.image_service)
         
         # Content Generation removed - moved to Review & Generate section
         
         # Template Selection
         template_version = TemplateForm.render()
         
-        # Create form data object
-        # Get existing form data to preserve image filenames
+        # Rebuild form data only when an input changed since the last rerun
         existing_form_data = getattr(st.session_state, 'form_data', None)
+        fingerprint = self._form_fingerprint(
+            basic_info, analysis_types, trade_plan, images, template_version
+        )
+        if existing_form_data is None or fingerprint != st.session_state.get('form_data_fingerprint'):
+            st.session_state.form_data = self._build_form_data(
+                basic_info, analysis_types, trade_plan, images, template_version,
+                existing_form_data
+            )
+            st.session_state.form_data_fingerprint = fingerprint
         
-        # Save uploaded images if any
-        company_logo_filename = None
-        chart_image_filename = None
+        # Navigation to Review & Generate
+        st.markdown(_FORM_COMPLETE_HTML, unsafe_allow_html=True)
         
-        if images['company_logo']:
-            company_logo_filename = self.image_service.save_uploaded_image(
-                images['company_logo'], 'company_logo'
-            )
-        elif images.get('company_logo_filename'):
-            company_logo_filename = images['company_logo_filename']
-        elif existing_form_data and existing_form_data.company_logo_filename:
+        st.button("📝 Generate Content", width='stretch',
+                  on_click=set_current_step, args=('review',))
+    
+    @staticmethod
+    def _form_fingerprint(basic_info: Dict[str, Any], analysis_types: List[str],
+                          trade_plan: Dict[str, float], images: Dict[str, Optional[str]],
+                          template_version: Any) -> int:
+        """
+        Compute a hash of the raw form inputs for change detection.
+        
+        Images are identified by their saved filenames, so hashing stays cheap
+        for large uploads.
+        """
+        return hash((
+            tuple(basic_info.items()),
+            tuple(analysis_types),
+            tuple(trade_plan.items()),
+            tuple(images.items()),
+            template_version
+        ))
+    
+    @staticmethod
+    def _build_form_data(basic_info: Dict[str, Any], analysis_types: List[str],
+                         trade_plan: Dict[str, float], images: Dict[str, Optional[str]],
+                         template_version: Any,
+                         existing_form_data: Optional[FormData]) -> FormData:
+        """
+        Build a FormData object from the rendered form inputs.
+        
+        Uploaded images are already saved by ImageUploadForm; falls back to
+        previously stored image filenames so uploads survive navigation.
+        """
+        company_logo_filename = images.get('company_logo_filename')
+        if not company_logo_filename and existing_form_data:
             company_logo_filename = existing_form_data.company_logo_filename
         
-        if images['chart_image']:
-            chart_image_filename = self.image_service.save_uploaded_image(
-                images['chart_image'], 'chart_image'
-            )
-        elif images.get('chart_image_filename'):
-            chart_image_filename = images['chart_image_filename']
-        elif existing_form_data and existing_form_data.chart_image_filename:
+        chart_image_filename = images.get('chart_image_filename')
+        if not chart_image_filename and existing_form_data:
             chart_image_filename = existing_form_data.chart_image_filename
         
-        form_data = FormData(
+        return FormData(
             category=basic_info['category'],
             action=basic_info['action'],
             ticker=basic_info['ticker'],
@@ -206,31 +272,11 @@ class InvestmentRecommendationApp:
             target_price=trade_plan['target_price'],
             stop_loss=trade_plan['stop_loss'],
             # content_source will be set in Review & Generate section
-            company_logo=images['company_logo'],
-            chart_image=images['chart_image'],
             company_logo_filename=company_logo_filename,
             chart_image_filename=chart_image_filename,
             template_version=template_version,
             timestamp=datetime.now().isoformat()
         )
-        
-        # Content generation moved to Review & Generate section
-        
-        # Store form data
-        st.session_state.form_data = form_data
-        
-        # Navigation to Review & Generate
-        st.markdown("---")
-        st.markdown("""
-        <div class="success-box">
-            <h3 style='color: #27ae60; margin: 0 0 8px 0;'>✅ Form Complete</h3>
-            <p style='color: #2e7d32; margin: 0;'>All form data has been collected. Ready to generate content and create your report.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if st.button("📝 Generate Content", width='stretch'):
-            st.session_state.current_step = 'review'
-            st.rerun()
     
     # _process_form_submission method removed - content generation moved to Review & Generate section
     
@@ -245,22 +291,19 @@ class InvestmentRecommendationApp:
         """
         if not st.session_state.form_data:
             st.info("Please fill out the form first in the Form Input section.")
-            if st.button("Go to Form Input"):
-                st.session_state.current_step = 'form'
-                st.rerun()
+            st.button("Go to Form Input", on_click=set_current_step, args=('form',))
             return
         
+        # Review components are only loaded once the review step is reached
+        from components import ContentReview, ReportGeneration
+        
         form_data = st.session_state.form_data
         
         # Restore content from session state if available (for persistence across navigation)
-        if 'human_executive_summary' in st.session_state:
-            form_data.human_executive_summary = st.session_state.human_executive_summary
-        if 'human_investment_rationale' in st.session_state:
-            form_data.human_investment_rationale = st.session_state.human_investment_rationale
-        if 'ai_executive_summary' in st.session_state:
-            form_data.ai_executive_summary = st.session_state.ai_executive_summary
-        if 'ai_investment_rationale' in st.session_state:
-            form_data.ai_investment_rationale = st.session_state.ai_investment_rationale
+        for attr in _PERSISTED_CONTENT_FIELDS:
+            value = st.session_state.get(attr)
+            if value is not None:
+                setattr(form_data, attr, value)
         
         # Content generation and editing
         content_updates = ContentReview.render(form_data)
@@ -270,20 +313,14 @@ class InvestmentRecommendationApp:
             if st.session_state.active_content_tab == 0:  # Human tab
                 form_data.human_executive_summary = content_updates.get('executive_summary', '')
                 form_data.human_investment_rationale = content_updates.get('investment_rationale', '')
-                form_data.content_source = ContentSource.HUMAN
             else:  # AI tab
                 form_data.ai_executive_summary = content_updates.get('executive_summary', '')
                 form_data.ai_investment_rationale = content_updates.get('investment_rationale', '')
-                form_data.content_source = ContentSource.AI
         
         # Ensure content source is set based on active tab
-        if st.session_state.active_content_tab == 0:
-            form_data.content_source = ContentSource.HUMAN
-        else:
-            form_data.content_source = ContentSource.AI
+        form_data.content_source = _TAB_TO_SOURCE[st.session_state.active_content_tab]
         
-        # Save updated form data back to session state
-        st.session_state.form_data = form_data
+        # form_data is the object held in session state, so no write-back is needed
         
         # Generate Report
         if ReportGeneration.render_generation_button():
@@ -305,24 +342,31 @@ class InvestmentRecommendationApp:
                 self.logger.info("Starting report generation")
                 
                 # CRITICAL: Ensure content source is correctly set based on active tab
-                if st.session_state.get('active_content_tab', 0) == 0:
-                    form_data.content_source = ContentSource.HUMAN
-                    self.logger.info("Content source set to HUMAN")
-                else:
-                    form_data.content_source = ContentSource.AI
-                    self.logger.info("Content source set to AI")
+                form_data.content_source = _TAB_TO_SOURCE[st.session_state.get('active_content_tab', 0)]
+                self.logger.info(f"Content source set to {form_data.content_source.name}")
                 
-                # Generate PDF
-                pdf_file, report_data = self.pdf_service.generate_report(form_data)
+                # Reuse the last report if the form data has not changed since
+                report_fingerprint = hashlib.sha256(
+                    json.dumps(form_data.to_dict(), sort_keys=True, default=str).encode('utf-8')
+                ).hexdigest()
+                last_report = st.session_state.get('last_generated_report')
+                if (last_report and last_report[0] == report_fingerprint
+                        and Path(last_report[1]).exists()):
+                    _, pdf_file, report_data = last_report
+                    self.logger.info(f"Form data unchanged, reusing report: {pdf_file}")
+                else:
+                    # Generate PDF
+                    pdf_file, report_data = self.pdf_service.generate_report(form_data)
+                    st.session_state.last_generated_report = (report_fingerprint, pdf_file, report_data)
+                    self.logger.info(f"Report generated successfully: {pdf_file}")
                 
                 # Display results
-                ReportGeneration.render(form_data, str(pdf_file), report_data.to_dict())
-                
-                self.logger.info(f"Report generated successfully: {pdf_file}")
+                from components import ReportGeneration
+                ReportGeneration.render(form_data, str(pdf_file), report_data)
                 
             except Exception as e:
                 self.logger.error(f"Error generating report: {e}", exc_info=True)
-                st.error(ERROR_MESSAGES['pdf_generation_failed'])
+                st.error(ErrorMessage.PDF_GENERATION_FAILED)
                 st.error("Please check the logs for more details.")
 
 
@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 """
 UI Components for Investment Recommendation Generator v2
+
+Components are imported lazily on first attribute access (PEP 562) so that
+only the submodules a page actually uses are loaded.
 """
 
-from .form_components import (
-    BasicInfoForm, AnalysisForm, TradePlanForm, 
-    ImageUploadForm, TemplateForm
-)
-from .review_components import ContentReview, ReportGeneration
-from .navigation import NavigationSidebar, AppHeader
-from .model_selector import ModelSelector
+from importlib import import_module
+
+# Public component name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'BasicInfoForm': '.form_components',
+    'AnalysisForm': '.form_components',
+    'TradePlanForm': '.form_components',
+    'ImageUploadForm': '.form_components',
+    'TemplateForm': '.form_components',
+    'ContentReview': '.review_components',
+    'ReportGeneration': '.review_components',
+    'NavigationSidebar': '.navigation',
+    'AppHeader': '.navigation',
+    'ModelSelector': '.model_selector',
+}
 
 __all__ = [
     'BasicInfoForm', 'AnalysisForm', 'TradePlanForm', 
@@ -18,3 +29,15 @@ __all__ = [
     'NavigationSidebar', 'AppHeader',
     'ModelSelector'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
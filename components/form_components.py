@@ -4,90 +4,208 @@ Form components for the investment recommendation form
 """
 
 import streamlit as st
-import os
-import base64
+from string import Template
+from types import MappingProxyType
 from typing import Dict, Any, List
 from models.form_data import FormData, AnalysisType, ContentSource, TemplateVersion
+from services.image_service import ImageService
 from config import (
     DEFAULT_FORM_CATEGORY, DEFAULT_FORM_ACTION, 
     DEFAULT_ENTRY_PRICE, DEFAULT_TARGET_PRICE, DEFAULT_STOP_LOSS,
-    TEMPLATE_PREVIEW_IMAGES, COLORS
+    TEMPLATE_PREVIEW_IMAGES, STATIC_DIR, IMAGES_DIR, COLORS,
+    ANALYSIS_TYPES, BUY_OR_ADD_ACTIONS, ErrorMessage, MIN_PRICE, MAX_PRICE
 )
 
 
-def get_template_preview_html(template_version: str) -> str:
-    """
-    Generate HTML for template preview.
-    
-    Args:
-        template_version: The template version ('v1', 'v2', 'v3')
-        
-    Returns:
-        str: HTML string for template preview
-    """
-    try:
-        templates_dir = os.path.join(os.path.dirname(__file__), '..', 'templates')
-        
-        # Template configuration
-        template_config = {
-            'v1': {
-                'image': 'v1_preview.png',
-                'border_color': COLORS['secondary'],
-                'name': 'Template v1',
-                'description': 'Classic layout with side-by-side elements'
-            },
-            'v2': {
-                'image': 'v2_preview.png',
-                'border_color': '#9b59b6',
-                'name': 'Template v2',
-                'description': 'Modern centered layout'
-            },
-            'v3': {
-                'image': 'v3_preview.png',
-                'border_color': COLORS['danger'],
-                'name': 'Template v3',
-                'description': 'Clean layout with dynamic checkboxes (New)'
-            }
-        }
-        
-        config = template_config.get(template_version, template_config['v2'])
-        image_path = os.path.join(templates_dir, config['image'])
-        border_color = config['border_color']
-        template_name = config['name']
-        description = config['description']
-        
-        # Read and encode the image
-        with open(image_path, 'rb') as img_file:
-            img_base64 = base64.b64encode(img_file.read()).decode('utf-8')
-        
-        return f"""
-            <div style='display: flex; flex-direction: column; align-items: center; background: #f8f9fa; padding: 12px; border-radius: 8px; border: 2px solid {border_color}; box-shadow: 0 4px 8px rgba(0,0,0,0.1); overflow: hidden; width: 100%; max-width: 100%; box-sizing: border-box;'>
+# Preview card configuration for each template version
+_TEMPLATE_PREVIEW_CONFIG = {
+    'v1': {
+        'image': 'v1_preview.png',
+        'border_color': COLORS['secondary'],
+        'name': 'Template v1',
+        'description': 'Classic layout with side-by-side elements'
+    },
+    'v2': {
+        'image': 'v2_preview.png',
+        'border_color': '#9b59b6',
+        'name': 'Template v2',
+        'description': 'Modern centered layout'
+    },
+    'v3': {
+        'image': 'v3_preview.png',
+        'border_color': COLORS['danger'],
+        'name': 'Template v3',
+        'description': 'Clean layout with dynamic checkboxes (New)'
+    }
+}
+
+
+# Preview images are served as static files; check which exist once at import
+_AVAILABLE_PREVIEWS = frozenset(
+    version for version, config in _TEMPLATE_PREVIEW_CONFIG.items()
+    if (STATIC_DIR / config['image']).exists()
+)
+
+
+# Preview card HTML, substituted once per template version
+_PREVIEW_CARD_TEMPLATE = Template("""
+            <div style='display: flex; flex-direction: column; align-items: center; background: #f8f9fa; padding: 12px; border-radius: 8px; border: 2px solid $border_color; box-shadow: 0 4px 8px rgba(0,0,0,0.1); overflow: hidden; width: 100%; max-width: 100%; box-sizing: border-box;'>
                 <div style='text-align: center; margin-bottom: 10px; width: 100%; max-width: 100%; overflow: hidden;'>
-                    <h3 style='margin: 0 0 3px 0; color: #2c3e50; font-size: 16px; font-weight: bold; word-wrap: break-word;'>{template_name}</h3>
-                    <p style='margin: 0; color: #6c757d; font-size: 12px; font-style: italic; word-wrap: break-word;'>{description}</p>
+                    <h3 style='margin: 0 0 3px 0; color: #2c3e50; font-size: 16px; font-weight: bold; word-wrap: break-word;'>$template_name</h3>
+                    <p style='margin: 0; color: #6c757d; font-size: 12px; font-style: italic; word-wrap: break-word;'>$description</p>
                 </div>
                 <div style='width: 100%; max-width: 100%; text-align: center; overflow: hidden; position: relative;'>
-                    <img src="data:image/png;base64,{img_base64}" 
+                    <img src="$image_url" 
                          style='max-width: 100%; width: auto; max-height: 250px; height: auto; border-radius: 6px; box-shadow: 0 3px 8px rgba(0,0,0,0.15); object-fit: contain; display: block; margin: 0 auto;' 
-                         alt='{template_name} Preview' />
+                         alt='$template_name Preview' />
                 </div>
                 <div style='margin-top: 8px; text-align: center; width: 100%; max-width: 100%; overflow: hidden;'>
-                    <div style='background: {border_color}; color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; display: inline-block; max-width: 100%; word-wrap: break-word;'>
+                    <div style='background: $border_color; color: white; padding: 6px 16px; border-radius: 20px; font-size: 12px; font-weight: 600; display: inline-block; max-width: 100%; word-wrap: break-word;'>
                         ✓ Currently Selected
                     </div>
                 </div>
             </div>
-        """
-        
-    except FileNotFoundError:
-        return f"""
+        """)
+
+_PREVIEW_MISSING_TEMPLATE = Template("""
             <div style='display: flex; justify-content: center; align-items: center; background: #f8f9fa; padding: 40px; border-radius: 8px; border: 2px solid #e74c3c;'>
                 <div style='text-align: center; color: #e74c3c;'>
                     <h3 style='margin: 0 0 10px 0;'>Preview Image Not Found</h3>
-                    <p style='margin: 0;'>Could not load {template_version}_preview.png</p>
+                    <p style='margin: 0;'>Could not load ${template_version}_preview.png</p>
                 </div>
             </div>
-        """
+        """)
+
+
+def _render_preview_html(template_version: str) -> str:
+    """Render the preview card (or not-found card) for one template version"""
+    config = _TEMPLATE_PREVIEW_CONFIG[template_version]
+    if template_version in _AVAILABLE_PREVIEWS:
+        return _PREVIEW_CARD_TEMPLATE.substitute(
+            image_url=f"app/static/{config['image']}",
+            border_color=config['border_color'],
+            template_name=config['name'],
+            description=config['description']
+        )
+    return _PREVIEW_MISSING_TEMPLATE.substitute(template_version=template_version)
+
+
+# All preview inputs are static, so render the final HTML once at import
+_PREVIEW_HTML = MappingProxyType({
+    version: _render_preview_html(version) for version in _TEMPLATE_PREVIEW_CONFIG
+})
+
+
+def get_template_preview_html(template_version: str) -> str:
+    """
+    Generate HTML for template preview.
+    
+    Preview images are referenced via Streamlit static file serving, so the
+    browser fetches and caches them once. The HTML for each template version
+    is rendered at import, so this is a dict lookup.
+    
+    Args:
+        template_version: The template version ('v1', 'v2', 'v3')
+        
+    Returns:
+        str: HTML string for template preview
+    """
+    return _PREVIEW_HTML.get(template_version, _PREVIEW_HTML['v2'])
+
+
+# Static section header HTML for each form section
+_SECTION_HEADER_HTML = {
+    'basic_info': (
+        '<div class="section-header">'
+        '<h3>📊 Investment Details</h3>'
+        '<p>Enter the core details for your investment recommendation</p>'
+        '</div>'
+    ),
+    'analysis': (
+        '<div class="section-header">'
+        '<h3>🔍 Analysis Framework</h3>'
+        '<p>Select the types of analysis to include</p>'
+        '</div>'
+    ),
+    'trade_plan': (
+        '<div class="section-header">'
+        '<h3>💰 Trade Plan</h3>'
+        '<p>Define your entry, target, and stop loss prices</p>'
+        '</div>'
+    ),
+    'trade_plan_exit': (
+        '<div class="section-header">'
+        '<h3>💰 Trade Plan</h3>'
+        '<p>Define your exit price</p>'
+        '</div>'
+    ),
+    'images': (
+        '<div class="section-header">'
+        '<h3>🖼️ Images</h3>'
+        '<p>Upload featured images and charts</p>'
+        '</div>'
+    ),
+    'template': (
+        '<div class="section-header">'
+        '<h3>🎨 Template Selection</h3>'
+        '<p>Choose your preferred report template layout and see a live preview</p>'
+        '</div>'
+    )
+}
+
+
+def _render_section_header(section: str) -> None:
+    """Emit a static section header via st.html, bypassing markdown parsing"""
+    st.html(_SECTION_HEADER_HTML[section])
+
+
+# Basic information select options and their option indexes
+_CATEGORY_OPTIONS = ['ASX Alpha', 'Global Alpha', 'High Conviction', 'ETF Elite', 'Structured Products']
+_CATEGORY_INDEX = {name: index for index, name in enumerate(_CATEGORY_OPTIONS)}
+_ACTION_OPTIONS = ['Buy', 'Add', 'Switch', 'Take Profit', 'Sell']
+_ACTION_INDEX = {name: index for index, name in enumerate(_ACTION_OPTIONS)}
+
+
+# FormData fields used as widget defaults; prices only count when positive
+_FORM_DEFAULT_FIELDS = (
+    'category', 'action', 'ticker', 'company_name', 'subtitle', 'analysis_types',
+    'company_logo_filename', 'chart_image_filename', 'template_version'
+)
+_FORM_DEFAULT_PRICE_FIELDS = ('entry_price', 'target_price', 'stop_loss', 'exit_price')
+
+
+def _get_form_defaults() -> Dict[str, Any]:
+    """
+    Collect widget defaults from the form data in session state in one pass.
+    
+    Only fields holding a usable value are included, so callers can rely on
+    dict.get() fallbacks instead of re-checking form_data and each field.
+    """
+    form_data = st.session_state.get('form_data')
+    if form_data is None:
+        return {}
+    
+    defaults = {}
+    for field_name in _FORM_DEFAULT_FIELDS:
+        value = getattr(form_data, field_name, None)
+        if value:
+            defaults[field_name] = value
+    for field_name in _FORM_DEFAULT_PRICE_FIELDS:
+        value = getattr(form_data, field_name, 0.0)
+        if value > 0:
+            defaults[field_name] = value
+    return defaults
+
+
+@st.cache_data(show_spinner=False, max_entries=16, ttl=3600)
+def _load_image_bytes(path: str, mtime: float) -> bytes:
+    """
+    Read a previously saved image from disk.
+    
+    Cached on (path, mtime) so reruns reuse the bytes until the file changes.
+    """
+    with open(path, 'rb') as image_file:
+        return image_file.read()
 
 
 class BasicInfoForm:
@@ -96,51 +214,34 @@ class BasicInfoForm:
     @staticmethod
     def render() -> Dict[str, Any]:
         """Render basic information form"""
-        st.markdown("""
-        <div class="section-header">
-            <h3>📊 Investment Details</h3>
-            <p>Enter the core details for your investment recommendation</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _render_section_header('basic_info')
         
         col1, col2 = st.columns(2)
         
         # Get default values from session state if available
-        form_data = getattr(st.session_state, 'form_data', None)
+        defaults = _get_form_defaults()
         
         with col1:
-            category_options = ['ASX Alpha', 'Global Alpha', 'High Conviction', 'ETF Elite', 'Structured Products']
-            category_default = 0
-            if form_data and form_data.category:
-                try:
-                    category_default = category_options.index(form_data.category)
-                except ValueError:
-                    category_default = 0
+            category_default = _CATEGORY_INDEX.get(defaults.get('category'), 0)
             
             category = st.selectbox(
                 "Category:",
-                options=category_options,
+                options=_CATEGORY_OPTIONS,
                 index=category_default,
                 key="form_category"
             )
         
         with col2:
-            action_options = ['Buy', 'Add', 'Switch', 'Take Profit', 'Sell']
-            action_default = 0
-            if form_data and form_data.action:
-                try:
-                    action_default = action_options.index(form_data.action)
-                except ValueError:
-                    action_default = 0
-                    
+            action_default = _ACTION_INDEX.get(defaults.get('action'), 0)
+            
             action = st.selectbox(
                 "Action:",
-                options=action_options,
+                options=_ACTION_OPTIONS,
                 index=action_default,
                 key="form_action"
             )
         
-        ticker_default = form_data.ticker if form_data and form_data.ticker else ""
+        ticker_default = defaults.get('ticker', "")
         ticker = st.text_input(
             "Ticker:",
             value=ticker_default,
@@ -148,7 +249,7 @@ class BasicInfoForm:
             key="form_ticker"
         ).upper()
         
-        company_name_default = form_data.company_name if form_data and form_data.company_name else ""
+        company_name_default = defaults.get('company_name', "")
         company_name = st.text_input(
             "Company Name:",
             value=company_name_default,
@@ -156,7 +257,7 @@ class BasicInfoForm:
             key="form_company_name"
         )
         
-        subtitle_default = form_data.subtitle if form_data and form_data.subtitle else ""
+        subtitle_default = defaults.get('subtitle', "")
         subtitle = st.text_input(
             "Subtitle:",
             value=subtitle_default,
@@ -179,45 +280,21 @@ class AnalysisForm:
     @staticmethod
     def render() -> List[AnalysisType]:
         """Render analysis types form"""
-        st.markdown("""
-        <div class="section-header">
-            <h3>🔍 Analysis Framework</h3>
-            <p>Select the types of analysis to include</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _render_section_header('analysis')
         
         # Get default values from session state if available
-        form_data = getattr(st.session_state, 'form_data', None)
-        fundamentals_default = False
-        technical_default = False
-        macro_default = False
-        catalyst_default = False
-        
-        if form_data and form_data.analysis_types:
-            fundamentals_default = 'Fundamentals' in form_data.analysis_types
-            technical_default = 'Technical Analysis' in form_data.analysis_types
-            macro_default = 'Macro/Geopolitical' in form_data.analysis_types
-            catalyst_default = 'Catalyst' in form_data.analysis_types
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fundamentals = st.checkbox("Fundamentals", value=fundamentals_default, key="form_fundamentals")
-            technical = st.checkbox("Technical Analysis", value=technical_default, key="form_technical")
-        
-        with col2:
-            macro = st.checkbox("Macro/Geopolitical", value=macro_default, key="form_macro")
-            catalyst = st.checkbox("Catalyst", value=catalyst_default, key="form_catalyst")
+        selected_default = _get_form_defaults().get('analysis_types', ())
+        analysis_default = [at for at in ANALYSIS_TYPES if at in selected_default]
+        
+        selected = st.multiselect(
+            "Analysis Types:",
+            options=ANALYSIS_TYPES,
+            default=analysis_default,
+            key="form_analysis_types"
+        )
         
-        analysis_types = []
-        if fundamentals:
-            analysis_types.append('Fundamentals')
-        if technical:
-            analysis_types.append('Technical Analysis')
-        if macro:
-            analysis_types.append('Macro/Geopolitical')
-        if catalyst:
-            analysis_types.append('Catalyst')
+        # Keep the canonical order regardless of selection order
+        analysis_types = [at for at in ANALYSIS_TYPES if at in selected]
         
         return analysis_types
 
@@ -232,23 +309,18 @@ class TradePlanForm:
         current_action = st.session_state.get('form_action', 'Buy')
         
         # Get default values from session state if available
-        form_data = getattr(st.session_state, 'form_data', None)
+        defaults = _get_form_defaults()
         
         # Determine if this is a Buy/Add/Switch action or Sell/Take Profit action
-        is_buy_or_add = current_action.lower() in ['buy', 'add', 'switch']
+        is_buy_or_add = current_action.lower() in BUY_OR_ADD_ACTIONS
         
         if is_buy_or_add:
             # Show entry, target, stop loss for Buy/Add actions
-            st.markdown("""
-            <div class="section-header">
-                <h3>💰 Trade Plan</h3>
-                <p>Define your entry, target, and stop loss prices</p>
-            </div>
-            """, unsafe_allow_html=True)
+            _render_section_header('trade_plan')
             
-            entry_default = form_data.entry_price if form_data and form_data.entry_price > 0 else 0.01
-            target_default = form_data.target_price if form_data and form_data.target_price > 0 else 0.01
-            stop_default = form_data.stop_loss if form_data and form_data.stop_loss > 0 else 0.01
+            entry_default = defaults.get('entry_price', 0.01)
+            target_default = defaults.get('target_price', 0.01)
+            stop_default = defaults.get('stop_loss', 0.01)
             
             col1, col2, col3 = st.columns(3)
             
@@ -256,6 +328,8 @@ class TradePlanForm:
                 entry_price = st.number_input(
                     "Entry Price:",
                     value=entry_default,
+                    min_value=MIN_PRICE,
+                    max_value=MAX_PRICE,
                     step=0.01,
                     key="form_entry_price"
                 )
@@ -264,6 +338,8 @@ class TradePlanForm:
                 target_price = st.number_input(
                     "Target Price:",
                     value=target_default,
+                    min_value=MIN_PRICE,
+                    max_value=MAX_PRICE,
                     step=0.01,
                     key="form_target_price"
                 )
@@ -272,6 +348,8 @@ class TradePlanForm:
                 stop_loss = st.number_input(
                     "Stop Loss:",
                     value=stop_default,
+                    min_value=MIN_PRICE,
+                    max_value=MAX_PRICE,
                     step=0.01,
                     key="form_stop_loss"
                 )
@@ -284,14 +362,9 @@ class TradePlanForm:
             }
         else:
             # Show only exit price for Sell/Take Profit actions
-            st.markdown("""
-            <div class="section-header">
-                <h3>💰 Trade Plan</h3>
-                <p>Define your exit price</p>
-            </div>
-            """, unsafe_allow_html=True)
+            _render_section_header('trade_plan_exit')
             
-            exit_default = form_data.exit_price if form_data and form_data.exit_price > 0 else 0.01
+            exit_default = defaults.get('exit_price', 0.01)
             
             col1, col2, col3 = st.columns(3)
             
@@ -299,6 +372,8 @@ class TradePlanForm:
                 exit_price = st.number_input(
                     "Exit Price:",
                     value=exit_default,
+                    min_value=MIN_PRICE,
+                    max_value=MAX_PRICE,
                     step=0.01,
                     key="form_exit_price"
                 )
@@ -321,17 +396,39 @@ class ImageUploadForm:
     """Component for image uploads"""
     
     @staticmethod
-    def render() -> Dict[str, Any]:
-        """Render image upload form"""
-        st.markdown("""
-        <div class="section-header">
-            <h3>🖼️ Images</h3>
-            <p>Upload featured images and charts</p>
-        </div>
-        """, unsafe_allow_html=True)
+    def _save_new_upload(image_service: ImageService, uploaded_file, filename_prefix: str,
+                         state_key: str) -> None:
+        """
+        Save an upload once per Streamlit file_id and keep only its filename
+        
+        Reruns with the same upload skip re-reading and re-hashing the file.
+        A failed save clears the stored filename and keeps reporting the error
+        until a different file is uploaded.
+        """
+        file_id_key = f"{state_key}_file_id"
+        if st.session_state.get(file_id_key) != uploaded_file.file_id:
+            saved_filename = image_service.save_uploaded_image(uploaded_file, filename_prefix)
+            st.session_state[file_id_key] = uploaded_file.file_id
+            if saved_filename:
+                st.session_state[state_key] = saved_filename
+            else:
+                st.session_state.pop(state_key, None)
+        
+        if state_key not in st.session_state:
+            st.error(ErrorMessage.IMAGE_UPLOAD_FAILED)
+    
+    @staticmethod
+    def render(image_service: ImageService) -> Dict[str, Any]:
+        """
+        Render image upload form
+        
+        New uploads are saved through image_service when first seen, and only
+        the saved filenames are returned and kept in session state.
+        """
+        _render_section_header('images')
         
         # Get previously uploaded images from session state
-        form_data = getattr(st.session_state, 'form_data', None)
+        defaults = _get_form_defaults()
         
         col1, col2 = st.columns(2)
         
@@ -344,32 +441,22 @@ class ImageUploadForm:
             
             # Handle new upload or show cached image
             if company_logo:
-                # New file uploaded - update session state and show preview
-                st.session_state.uploaded_company_logo = company_logo
+                # New file uploaded - save it and keep only the filename in session state
+                ImageUploadForm._save_new_upload(image_service, company_logo, 'company_logo', 'uploaded_company_logo')
                 st.image(company_logo, caption="Featured Image Preview", width='stretch')
             elif 'uploaded_company_logo' in st.session_state:
-                # Show previously uploaded image from session state
-                if isinstance(st.session_state.uploaded_company_logo, str):
-                    # It's a filename, show the saved image
-                    from pathlib import Path
-                    from config import IMAGES_DIR
-                    image_path = IMAGES_DIR / st.session_state.uploaded_company_logo
-                    if image_path.exists():
-                        st.image(str(image_path), caption="Previously Uploaded Featured Image", width='stretch')
-                        st.info(f"📷 Using previously uploaded: {st.session_state.uploaded_company_logo}")
-                else:
-                    # It's a file object, show it
-                    st.image(st.session_state.uploaded_company_logo, caption="Previously Uploaded Featured Image", width='stretch')
-                    st.info("📷 Using previously uploaded image")
-            elif form_data and form_data.company_logo_filename:
+                # Show the previously saved image from session state
+                image_path = IMAGES_DIR / st.session_state.uploaded_company_logo
+                if image_path.exists():
+                    st.image(_load_image_bytes(str(image_path), image_path.stat().st_mtime), caption="Previously Uploaded Featured Image", width='stretch')
+                    st.info(f"📷 Using previously uploaded: {st.session_state.uploaded_company_logo}")
+            elif defaults.get('company_logo_filename'):
                 # Restore from form data if no session state
-                from pathlib import Path
-                from config import IMAGES_DIR
-                image_path = IMAGES_DIR / form_data.company_logo_filename
+                image_path = IMAGES_DIR / defaults['company_logo_filename']
                 if image_path.exists():
-                    st.session_state.uploaded_company_logo = form_data.company_logo_filename
-                    st.image(str(image_path), caption="Previously Uploaded Featured Image", width='stretch')
-                    st.info(f"📷 Using previously uploaded: {form_data.company_logo_filename}")
+                    st.session_state.uploaded_company_logo = defaults['company_logo_filename']
+                    st.image(_load_image_bytes(str(image_path), image_path.stat().st_mtime), caption="Previously Uploaded Featured Image", width='stretch')
+                    st.info(f"📷 Using previously uploaded: {defaults['company_logo_filename']}")
         
         with col2:
             chart_image = st.file_uploader(
@@ -380,38 +467,27 @@ class ImageUploadForm:
             
             # Handle new upload or show cached image
             if chart_image:
-                # New file uploaded - update session state and show preview
-                st.session_state.uploaded_chart_image = chart_image
+                # New file uploaded - save it and keep only the filename in session state
+                ImageUploadForm._save_new_upload(image_service, chart_image, 'chart_image', 'uploaded_chart_image')
                 st.image(chart_image, caption="Chart Image Preview", width='stretch')
             elif 'uploaded_chart_image' in st.session_state:
-                # Show previously uploaded image from session state
-                if isinstance(st.session_state.uploaded_chart_image, str):
-                    # It's a filename, show the saved image
-                    from pathlib import Path
-                    from config import IMAGES_DIR
-                    image_path = IMAGES_DIR / st.session_state.uploaded_chart_image
-                    if image_path.exists():
-                        st.image(str(image_path), caption="Previously Uploaded Chart Image", width='stretch')
-                        st.info(f"📊 Using previously uploaded: {st.session_state.uploaded_chart_image}")
-                else:
-                    # It's a file object, show it
-                    st.image(st.session_state.uploaded_chart_image, caption="Previously Uploaded Chart Image", width='stretch')
-                    st.info("📊 Using previously uploaded image")
-            elif form_data and form_data.chart_image_filename:
+                # Show the previously saved image from session state
+                image_path = IMAGES_DIR / st.session_state.uploaded_chart_image
+                if image_path.exists():
+                    st.image(_load_image_bytes(str(image_path), image_path.stat().st_mtime), caption="Previously Uploaded Chart Image", width='stretch')
+                    st.info(f"📊 Using previously uploaded: {st.session_state.uploaded_chart_image}")
+            elif defaults.get('chart_image_filename'):
                 # Restore from form data if no session state
-                from pathlib import Path
-                image_path = Path("images") / form_data.chart_image_filename
+                image_path = IMAGES_DIR / defaults['chart_image_filename']
                 if image_path.exists():
-                    st.session_state.uploaded_chart_image = form_data.chart_image_filename
-                    st.image(str(image_path), caption="Previously Uploaded Chart Image", width='stretch')
-                    st.info(f"📊 Using previously uploaded: {form_data.chart_image_filename}")
+                    st.session_state.uploaded_chart_image = defaults['chart_image_filename']
+                    st.image(_load_image_bytes(str(image_path), image_path.stat().st_mtime), caption="Previously Uploaded Chart Image", width='stretch')
+                    st.info(f"📊 Using previously uploaded: {defaults['chart_image_filename']}")
         
-        # Return current uploads or preserve existing filenames from session state
+        # Return the saved filenames from session state
         return {
-            'company_logo': company_logo,
-            'chart_image': chart_image,
-            'company_logo_filename': st.session_state.get('uploaded_company_logo') if not company_logo else None,
-            'chart_image_filename': st.session_state.get('uploaded_chart_image') if not chart_image else None
+            'company_logo_filename': st.session_state.get('uploaded_company_logo'),
+            'chart_image_filename': st.session_state.get('uploaded_chart_image')
         }
 
 
@@ -424,25 +500,18 @@ class TemplateForm:
     @staticmethod
     def render() -> TemplateVersion:
         """Render template selection form"""
-        st.markdown("""
-        <div class="section-header">
-            <h3>🎨 Template Selection</h3>
-            <p>Choose your preferred report template layout and see a live preview</p>
-        </div>
-        """, unsafe_allow_html=True)
+        _render_section_header('template')
         
         col1, col2 = st.columns([1, 2])
         
         with col1:
-            # Get default template from session state if available
-            form_data = getattr(st.session_state, 'form_data', None)
+            # Get default template from session state if available (default to v3)
             template_options = [TemplateVersion.V1, TemplateVersion.V2, TemplateVersion.V3]
-            template_default = 2  # Default to v3
-            if form_data and hasattr(form_data, 'template_version'):
-                try:
-                    template_default = template_options.index(form_data.template_version)
-                except ValueError:
-                    template_default = 2
+            template_version_default = _get_form_defaults().get('template_version')
+            template_default = (
+                template_options.index(template_version_default)
+                if template_version_default in template_options else 2
+            )
             
             template_version = st.radio(
                 "Select Template:",
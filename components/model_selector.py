@@ -3,11 +3,49 @@
 Model selector component for OpenRouter models
 """
 
+import functools
 import streamlit as st
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 from services.openrouter_models import OpenRouterModelManager, OpenRouterModel
 
 
+@functools.lru_cache(maxsize=8)
+def _build_model_options(
+    models_signature: Tuple[Tuple[str, str, str], ...],
+    compact: bool = False
+) -> Tuple[Mapping[str, str], Tuple[str, ...], Mapping[str, int]]:
+    """
+    Build the selectbox options for the given models.
+    
+    Args:
+        models_signature: (model_id, display_name, context_display) per model
+        compact: Use the short "(64K)" suffix instead of "(64K context)"
+        
+    Returns:
+        Tuple of (display name -> model id mapping, ordered display names,
+        display name -> option index mapping). The values are read-only
+        because the same objects are shared by every caller of the cache.
+    """
+    suffix = "" if compact else " context"
+    model_options = {
+        f"{display_name} ({context_display}{suffix})": model_id
+        for model_id, display_name, context_display in models_signature
+    }
+    display_names = tuple(model_options)
+    display_to_index = {name: index for index, name in enumerate(display_names)}
+    return MappingProxyType(model_options), display_names, MappingProxyType(display_to_index)
+
+
+def _get_model_options(compact: bool = False) -> Tuple[Mapping[str, str], Tuple[str, ...], Mapping[str, int]]:
+    """Get cached selectbox options for all free models"""
+    models = OpenRouterModelManager.get_free_models()
+    return _build_model_options(tuple(
+        (model_id, model.display_name, model.context_display)
+        for model_id, model in models.items()
+    ), compact)
+
+
 class ModelSelector:
     """Component for selecting OpenRouter models"""
     
@@ -24,26 +62,15 @@ class ModelSelector:
         # Initialize session state
         OpenRouterModelManager.initialize_session_state()
         
-        # Get all free models
-        models = OpenRouterModelManager.get_free_models()
-        
-        # Create model options for selectbox
-        model_options = {}
-        for model_id, model in models.items():
-            # Create simple display name with just name and context
-            display_name = f"{model.display_name} ({model.context_display} context)"
-            model_options[display_name] = model_id
+        # Create model options for all free models (cached across reruns)
+        model_options, display_names, display_to_index = _get_model_options()
         
         # Get current selection
         current_model = OpenRouterModelManager.get_selected_model()
         current_display_name = f"{current_model.display_name} ({current_model.context_display} context)"
         
         # Find the current selection index
-        display_names = list(model_options.keys())
-        try:
-            current_index = display_names.index(current_display_name)
-        except ValueError:
-            current_index = 0
+        current_index = display_to_index.get(current_display_name, 0)
         
         # Model selector with refresh button
         col1, col2 = st.columns([4, 1])
@@ -60,6 +87,7 @@ class ModelSelector:
         with col2:
             if st.button("🔄", key="refresh_models", help="Refresh models from API"):
                 OpenRouterModelManager.refresh_models()
+                _build_model_options.cache_clear()
                 st.rerun()
         
         # Update session state if selection changed
@@ -117,26 +145,15 @@ class ModelSelector:
         # Initialize session state
         OpenRouterModelManager.initialize_session_state()
         
-        # Get all free models
-        models = OpenRouterModelManager.get_free_models()
-        
-        # Create model options for selectbox
-        model_options = {}
-        for model_id, model in models.items():
-            # Create compact display name
-            display_name = f"{model.display_name} ({model.context_display})"
-            model_options[display_name] = model_id
+        # Create compact model options for all free models (cached across reruns)
+        model_options, display_names, display_to_index = _get_model_options(compact=True)
         
         # Get current selection
         current_model = OpenRouterModelManager.get_selected_model()
         current_display_name = f"{current_model.display_name} ({current_model.context_display})"
         
         # Find the current selection index
-        display_names = list(model_options.keys())
-        try:
-            current_index = display_names.index(current_display_name)
-        except ValueError:
-            current_index = 0
+        current_index = display_to_index.get(current_display_name, 0)
         
         # Compact model selector
         selected_display_name = st.selectbox(
@@ -7,6 +7,20 @@ import streamlit as st
 from config import APP_TITLE, APP_ICON
 
 
+# Session state key prefixes cleared by the Reset Form button
+_RESET_KEY_PREFIXES = ('form_', 'ai_', 'content_', 'template_', 'uploaded_')
+
+
+def set_current_step(step: str) -> None:
+    """
+    Button callback that switches the application step.
+    
+    Callbacks run before the rerun triggered by the click, so the new step
+    renders in that same run instead of needing a second st.rerun() pass.
+    """
+    st.session_state.current_step = step
+
+
 class AppHeader:
     """Application header component"""
     
@@ -36,22 +50,19 @@ class NavigationSidebar:
             """, unsafe_allow_html=True)
             
             # Navigation buttons
-            if st.button("📝 Form Input", width='stretch'):
-                st.session_state.current_step = 'form'
-                st.rerun()
+            st.button("📝 Form Input", width='stretch',
+                      on_click=set_current_step, args=('form',))
             
-            if st.button("📋 Generate Content", width='stretch'):
-                st.session_state.current_step = 'review'
-                st.rerun()
+            st.button("📋 Generate Content", width='stretch',
+                      on_click=set_current_step, args=('review',))
             
             # Reset button
             st.markdown("---")
-            if st.button("🔄 Reset Form", width='stretch'):
-                NavigationSidebar._reset_form()
+            st.button("🔄 Reset Form", width='stretch', on_click=NavigationSidebar._reset_form)
     
     @staticmethod
     def _reset_form():
-        """Reset the form data while preserving analysis checkboxes and images"""
+        """Reset the form data while preserving analysis types and images (button callback)"""
         # Preserve important form data
         preserved_data = {}
         if 'form_data' in st.session_state:
@@ -71,9 +82,11 @@ class NavigationSidebar:
             preserved_uploaded_images['uploaded_chart_image'] = st.session_state.uploaded_chart_image
         
         # Clear all form data
-        for key in list(st.session_state.keys()):
-            if key.startswith(('form_', 'ai_', 'content_', 'template_', 'uploaded_')):
-                del st.session_state[key]
+        for key in [key for key in st.session_state.keys() if key.startswith(_RESET_KEY_PREFIXES)]:
+            del st.session_state[key]
+        
+        # Let the app re-apply session defaults for the cleared keys
+        st.session_state.pop('session_defaults_initialized', None)
         
         # Restore preserved data
         if preserved_data:
@@ -88,4 +101,3 @@ class NavigationSidebar:
             st.session_state[key] = value
         
         st.session_state.current_step = 'form'
-        st.rerun()
@@ -4,10 +4,96 @@ QuillJS rich text editor component for Streamlit
 Consolidated from multiple files into one clean implementation
 """
 
+import functools
+import nh3
 import streamlit as st
-from streamlit_quill import st_quill
 from typing import Optional
 
+# Probe the QuillJS component once at import instead of on every render
+try:
+    from streamlit_quill import st_quill
+    _QUILL_AVAILABLE = True
+except ImportError:
+    st_quill = None
+    _QUILL_AVAILABLE = False
+
+# QuillJS toolbar configuration shared by all editors
+_QUILL_TOOLBAR = [
+    # Header options (H1, H2, H3, Normal)
+    [{"header": [1, 2, 3, False]}],
+    
+    # Text formatting
+    ["bold", "italic", "underline", "strike"],
+    
+    # Text color
+    [{"color": []}],
+    
+    # Lists and indentation
+    [{"list": "ordered"}, {"list": "bullet"}],
+    [{"indent": "-1"}, {"indent": "+1"}],
+    
+    # Text alignment
+    [{"align": []}],
+    
+    # Special formatting
+    ["blockquote", "code-block"],
+    
+    # Links
+    ["link"],
+    
+    # Utility
+    ["clean"]
+]
+
+# Tags and attributes the toolbar above can produce
+_ALLOWED_TAGS = {
+    "p", "br", "h1", "h2", "h3", "strong", "b", "em", "i", "u", "s",
+    "span", "ol", "ul", "li", "blockquote", "pre", "code", "a"
+}
+_ALLOWED_ATTRIBUTES = {
+    "*": {"class", "style"},
+    "a": {"href", "target"},
+}
+
+
+def _sanitize_html(html: str) -> str:
+    """Strip anything the Quill toolbar cannot produce from editor HTML"""
+    if not html:
+        return html
+    return nh3.clean(html, tags=_ALLOWED_TAGS, attributes=_ALLOWED_ATTRIBUTES)
+
+
+@functools.lru_cache(maxsize=None)
+def _editor_height_css(height: int) -> str:
+    """Build the editor height <style> block once per distinct height"""
+    return (
+        "<style>.ql-editor {"
+        f"min-height: {height}px !important; "
+        f"max-height: {height * 2}px !important;"
+        "}</style>"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _default_editor_key(label: str) -> str:
+    """Build the default widget key for a label once per distinct label"""
+    return f"quill_editor_{label.replace(' ', '_').lower()}"
+
+
+def _fallback_text_area(label: str, value: str, key: str, height: int) -> str:
+    """
+    Plain text area used when the QuillJS editor cannot be rendered.
+    
+    Returns the raw text: it is not HTML, and running it through nh3 would
+    entity-escape it again each time the value is fed back into the widget.
+    """
+    return st.text_area(
+        label=f"{label} (Fallback)",
+        value=value,
+        height=height,
+        key=f"{key}_fallback"
+    )
+
 
 def quill_rich_text_editor(
     label: str,
@@ -32,73 +118,36 @@ def quill_rich_text_editor(
     
     # Generate unique key if not provided
     if key is None:
-        key = f"quill_editor_{label.replace(' ', '_').lower()}"
+        key = _default_editor_key(label)
     
     # Create a container for the editor
     with st.container():
         st.markdown(f"**{label}**")
         
         # Add CSS for QuillJS editor height
-        st.markdown(f"""
-        <style>
-        .ql-editor {{
-            min-height: {height}px !important;
-            max-height: {height * 2}px !important;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
+        st.html(_editor_height_css(height))
         
-        # Configure QuillJS toolbar with useful options
-        toolbar_options = [
-            # Header options (H1, H2, H3, Normal)
-            [{"header": [1, 2, 3, False]}],
-            
-            # Text formatting
-            ["bold", "italic", "underline", "strike"],
-            
-            # Text color
-            [{"color": []}],
-            
-            # Lists and indentation
-            [{"list": "ordered"}, {"list": "bullet"}],
-            [{"indent": "-1"}, {"indent": "+1"}],
-            
-            # Text alignment
-            [{"align": []}],
-            
-            # Special formatting
-            ["blockquote", "code-block"],
-            
-            # Links
-            ["link"],
-            
-            # Utility
-            ["clean"]
-        ]
+        if not _QUILL_AVAILABLE:
+            st.warning("Falling back to text area: streamlit-quill is not installed")
+            return _fallback_text_area(label, value, key, height)
         
         # Create the QuillJS editor
         try:
             content = st_quill(
                 value=value,
                 html=True,
-                toolbar=toolbar_options,
+                toolbar=_QUILL_TOOLBAR,
                 placeholder=placeholder,
                 key=key
             )
-            
-            # Return the HTML content
-            return content if content is not None else value
-            
         except Exception as e:
+            # The component can still fail at render time (e.g. frontend assets)
             st.error(f"Error with QuillJS editor: {e}")
-            # Fallback to text area
             st.warning("Falling back to text area due to QuillJS error")
-            return st.text_area(
-                label=f"{label} (Fallback)",
-                value=value,
-                height=height,
-                key=f"{key}_fallback"
-            )
+            return _fallback_text_area(label, value, key, height)
+        
+        # Return the sanitized HTML content
+        return _sanitize_html(content) if content is not None else value
 
 
 def quill_editor(
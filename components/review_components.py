@@ -3,9 +3,95 @@
 Review components for content review and report generation
 """
 
+import os
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict
 from models.form_data import FormData
+from models.report_data import ReportData
+
+
+_CONTENT_TAB_LABELS = ("✍️ Human Written", "🤖 AI Generated")
+
+
+def _sync_content_tab() -> None:
+    """Copy the radio selection into active_content_tab, which outlives the widget"""
+    st.session_state.active_content_tab = st.session_state.active_content_tab_radio
+
+
+def _content_default(form_data: FormData, field: str, session_first: bool = False) -> str:
+    """
+    Resolve a content field from form_data and session state
+    
+    Args:
+        form_data: Form data object to read from
+        field: Content field name, also used as the session state key
+        session_first: Prefer the session state value over form_data
+        
+    Returns:
+        The first non-empty value, or an empty string
+    """
+    if session_first:
+        return st.session_state.get(field) or getattr(form_data, field, '') or ''
+    return getattr(form_data, field, '') or st.session_state.get(field) or ''
+
+
+def _persist_content(form_data: FormData, values: Dict[str, str]) -> None:
+    """
+    Write content fields to form_data and session state in one place
+    
+    Args:
+        form_data: Form data object to update
+        values: Field name to content mapping
+    """
+    st.session_state.update(values)
+    stored_form_data = st.session_state.get('form_data')
+    for field, value in values.items():
+        setattr(form_data, field, value)
+        # Also update the form_data held in session state if it is a different object
+        if stored_form_data is not None and stored_form_data is not form_data:
+            setattr(stored_form_data, field, value)
+
+
+@st.fragment
+def _render_editors(form_data: FormData, prefix: str, exec_default: str,
+                    rationale_default: str, key_suffix: str = "") -> None:
+    """
+    Render the summary and rationale editors as a fragment
+    
+    Typing in an editor only reruns this function, not the whole app.
+    Fragment return values are dropped on fragment reruns, so the content
+    is handed back through session state and form_data instead.
+    
+    Args:
+        form_data: Form data object to update with the edited content
+        prefix: Content prefix, 'human' or 'ai'
+        exec_default: Initial summary HTML
+        rationale_default: Initial investment rationale HTML
+        key_suffix: Suffix appended to the editor widget keys
+    """
+    from components.quill_editor import quill_editor
+    
+    st.markdown("**Summary:**")
+    executive_summary = quill_editor(
+        label="",
+        value=exec_default,
+        key=f"review_{prefix}_exec_summary{key_suffix}",
+        height=200
+    )
+    
+    st.markdown("")  # Add some spacing
+    st.markdown("**Investment Rationale:**")
+    investment_rationale = quill_editor(
+        label="",
+        value=rationale_default,
+        key=f"review_{prefix}_inv_rationale{key_suffix}",
+        height=300
+    )
+    
+    _persist_content(form_data, {
+        f"{prefix}_executive_summary": executive_summary,
+        f"{prefix}_investment_rationale": investment_rationale
+    })
 
 
 class ContentReview:
@@ -31,20 +117,17 @@ class ContentReview:
         if 'active_content_tab' not in st.session_state:
             st.session_state.active_content_tab = 0 if current_source == ContentSource.HUMAN else 1
         
-        # Create a custom tab-like interface with buttons next to each other
-        col1, col2 = st.columns([1, 1])  # Equal width columns for compact layout
-        
-        with col1:
-            human_active = st.session_state.active_content_tab == 0
-            if st.button("✍️ Human Written", key="human_tab", type="primary" if human_active else "secondary", use_container_width=True):
-                st.session_state.active_content_tab = 0
-                st.rerun()
-        
-        with col2:
-            ai_active = st.session_state.active_content_tab == 1
-            if st.button("🤖 AI Generated", key="ai_tab", type="primary" if ai_active else "secondary", use_container_width=True):
-                st.session_state.active_content_tab = 1
-                st.rerun()
+        # Tab-like source switch: a single horizontal radio reruns on change by itself
+        st.radio(
+            "Content source",
+            options=(0, 1),
+            format_func=_CONTENT_TAB_LABELS.__getitem__,
+            index=st.session_state.active_content_tab,
+            horizontal=True,
+            label_visibility="collapsed",
+            key="active_content_tab_radio",
+            on_change=_sync_content_tab
+        )
         
         # Render content based on active tab
         if st.session_state.active_content_tab == 0:
@@ -100,41 +183,33 @@ class ContentReview:
         st.markdown("")  # Add some spacing
         
         if st.button("🤖 Generate AI Content", key="generate_ai_content", use_container_width=True):
+            stream_placeholder = st.empty()
             with st.spinner(f"Generating AI content using {selected_model.display_name if selected_model else 'selected model'}..."):
                 from services.openrouter_ai_service import OpenRouterAIService
                 ai_service = OpenRouterAIService.get_instance()
                 try:
-                    executive_summary, investment_rationale = ai_service.generate_content(form_data)
+                    # Stream the responses so text shows up as soon as the model starts answering
+                    with stream_placeholder.container():
+                        executive_summary, investment_rationale = ai_service.generate_content(form_data, stream=True)
+                    stream_placeholder.empty()
                     
-                    # Store in form_data
-                    form_data.ai_executive_summary = executive_summary
-                    form_data.ai_investment_rationale = investment_rationale
-                    
-                    # Store in session state for persistence (this will update the editors)
-                    st.session_state.ai_executive_summary = executive_summary
-                    st.session_state.ai_investment_rationale = investment_rationale
-                    
-                    # Also update form_data in session state to ensure persistence
-                    if 'form_data' in st.session_state:
-                        st.session_state.form_data.ai_executive_summary = executive_summary
-                        st.session_state.form_data.ai_investment_rationale = investment_rationale
+                    # Store the content for persistence (this will update the editors)
+                    _persist_content(form_data, {
+                        'ai_executive_summary': executive_summary,
+                        'ai_investment_rationale': investment_rationale
+                    })
                     
                     # Update editor refresh key to force QuillJS editors to reload with new content
-                    import time
-                    st.session_state.ai_content_refresh_key = int(time.time() * 1000)
+                    st.session_state.ai_content_refresh_key = st.session_state.get('ai_content_refresh_key', 0) + 1
                     
-                    # Force refresh to show new content in editors
+                    # The editors below are rendered later in this run, so no rerun is needed
                     st.success(f"AI content generated successfully using {selected_model.display_name if selected_model else 'selected model'}!")
-                    st.rerun()
                 except Exception as e:
                     st.error(f"Error generating AI content: {e}")
         
         # Display generated content for review
         # Check both form_data and session state for AI content
-        has_ai_content = (
-            (hasattr(form_data, 'ai_executive_summary') and form_data.ai_executive_summary) or
-            ('ai_executive_summary' in st.session_state and st.session_state.ai_executive_summary)
-        )
+        has_ai_content = bool(_content_default(form_data, 'ai_executive_summary'))
         
         if has_ai_content:
             st.markdown("""
@@ -144,55 +219,19 @@ class ContentReview:
             </div>
             """, unsafe_allow_html=True)
             
-            from components.quill_editor import quill_editor
-            
             # Get existing content with priority to session state (most recent)
             # Session state always has the latest generated content
-            ai_exec_default = st.session_state.get('ai_executive_summary', '')
-            ai_rationale_default = st.session_state.get('ai_investment_rationale', '')
-            
-            # Fallback to form_data if session state is empty (shouldn't happen after generation)
-            if not ai_exec_default and hasattr(form_data, 'ai_executive_summary'):
-                ai_exec_default = form_data.ai_executive_summary
-            if not ai_rationale_default and hasattr(form_data, 'ai_investment_rationale'):
-                ai_rationale_default = form_data.ai_investment_rationale
+            ai_exec_default = _content_default(form_data, 'ai_executive_summary', session_first=True)
+            ai_rationale_default = _content_default(form_data, 'ai_investment_rationale', session_first=True)
             
             # Get refresh key for editor reloading
             refresh_key = st.session_state.get('ai_content_refresh_key', 0)
             
-            st.markdown("**Summary:**")
-            executive_summary = quill_editor(
-                label="",
-                value=ai_exec_default,
-                key=f"review_ai_exec_summary_{refresh_key}",
-                height=200
-            )
-            
-            st.markdown("")  # Add some spacing
-            st.markdown("**Investment Rationale:**")
-            investment_rationale = quill_editor(
-                label="",
-                value=ai_rationale_default,
-                key=f"review_ai_inv_rationale_{refresh_key}",
-                height=300
-            )
-            
-            # Store content in session state for persistence
-            st.session_state.ai_executive_summary = executive_summary
-            st.session_state.ai_investment_rationale = investment_rationale
-            
-            # Update form_data with AI content (same as human section)
-            form_data.ai_executive_summary = executive_summary
-            form_data.ai_investment_rationale = investment_rationale
-            
-            # CRITICAL: Also update the form_data in session state to ensure persistence
-            if 'form_data' in st.session_state:
-                st.session_state.form_data.ai_executive_summary = executive_summary
-                st.session_state.form_data.ai_investment_rationale = investment_rationale
+            _render_editors(form_data, 'ai', ai_exec_default, ai_rationale_default, f"_{refresh_key}")
             
             return {
-                'executive_summary': executive_summary,
-                'investment_rationale': investment_rationale
+                'executive_summary': st.session_state.ai_executive_summary,
+                'investment_rationale': st.session_state.ai_investment_rationale
             }
         else:
             return {
@@ -210,53 +249,17 @@ class ContentReview:
         </div>
         """, unsafe_allow_html=True)
         
-        from components.quill_editor import quill_editor
-        
         # Get existing content if available, with fallback to session state
-        human_exec_default = getattr(form_data, 'human_executive_summary', '')
-        human_rationale_default = getattr(form_data, 'human_investment_rationale', '')
-        
-        # Check if content exists in session state (for persistence across navigation)
-        if 'human_executive_summary' in st.session_state and not human_exec_default:
-            human_exec_default = st.session_state.human_executive_summary
-        if 'human_investment_rationale' in st.session_state and not human_rationale_default:
-            human_rationale_default = st.session_state.human_investment_rationale
+        human_exec_default = _content_default(form_data, 'human_executive_summary')
+        human_rationale_default = _content_default(form_data, 'human_investment_rationale')
         
         st.markdown("**Write Your Content:**")
         st.markdown("")  # Add some spacing
-        st.markdown("**Summary:**")
-        executive_summary = quill_editor(
-            label="",
-            value=human_exec_default,
-            key="review_human_exec_summary",
-            height=200
-        )
-        
-        st.markdown("")  # Add some spacing
-        st.markdown("**Investment Rationale:**")
-        investment_rationale = quill_editor(
-            label="",
-            value=human_rationale_default,
-            key="review_human_inv_rationale",
-            height=300
-        )
-        
-        # Store content in session state for persistence
-        st.session_state.human_executive_summary = executive_summary
-        st.session_state.human_investment_rationale = investment_rationale
-        
-        # Update form_data with human content
-        form_data.human_executive_summary = executive_summary
-        form_data.human_investment_rationale = investment_rationale
-        
-        # CRITICAL: Also update the form_data in session state to ensure persistence
-        if 'form_data' in st.session_state:
-            st.session_state.form_data.human_executive_summary = executive_summary
-            st.session_state.form_data.human_investment_rationale = investment_rationale
+        _render_editors(form_data, 'human', human_exec_default, human_rationale_default)
         
         return {
-            'executive_summary': executive_summary,
-            'investment_rationale': investment_rationale
+            'executive_summary': st.session_state.human_executive_summary,
+            'investment_rationale': st.session_state.human_investment_rationale
         }
 
 
@@ -264,20 +267,25 @@ class ReportGeneration:
     """Component for report generation and display"""
     
     @staticmethod
-    def render(form_data: FormData, pdf_file_path: str, report_data: Dict[str, Any]):
+    def render(form_data: FormData, pdf_file_path: str, report_data: ReportData):
         """Render report generation results"""
         st.success("Final report generated successfully!")
         
         
+        # Only re-read the PDF from disk when the file has changed
+        pdf_cache_key = (pdf_file_path, os.stat(pdf_file_path).st_mtime_ns)
+        if st.session_state.get('pdf_cache_key') != pdf_cache_key:
+            with open(pdf_file_path, "rb") as pdf_file_obj:
+                st.session_state.pdf_bytes = pdf_file_obj.read()
+            st.session_state.pdf_cache_key = pdf_cache_key
+        
         # Download button
-        with open(pdf_file_path, "rb") as pdf_file_obj:
-            pdf_bytes = pdf_file_obj.read()
-            st.download_button(
-                label="📄 Download PDF Report",
-                data=pdf_bytes,
-                file_name=pdf_file_path.split('/')[-1],
-                mime="application/pdf"
-            )
+        st.download_button(
+            label="📄 Download PDF Report",
+            data=st.session_state.pdf_bytes,
+            file_name=os.path.basename(pdf_file_path),
+            mime="application/pdf"
+        )
         
         st.info(f"📁 File saved to: {pdf_file_path}")
     
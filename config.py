@@ -5,8 +5,10 @@ Centralized configuration for maintainability and consistency
 """
 
 import os
+from enum import StrEnum
 from pathlib import Path
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, Tuple
 
 # Base directory
 BASE_DIR = Path(__file__).parent
@@ -18,18 +20,19 @@ LOGS_DIR = DATA_DIR / "logs"
 TEMP_DIR = DATA_DIR / "temp"
 IMAGES_DIR = DATA_DIR / "images"
 TEMPLATES_DIR = BASE_DIR / "templates"
+STATIC_DIR = BASE_DIR / "static"  # Served by Streamlit at /app/static
 
 # File paths
 LOGO_PATH = TEMPLATES_DIR / "mpc_logo.png"
 
 # LLM Configuration
-LLM_CONFIG: Dict[str, any] = {
+LLM_CONFIG: Mapping[str, Any] = MappingProxyType({
     'min_intelligence': 8,
     'min_speed': 6,
     'min_context_window': 40000,
     'max_cost': 0,
     'preferred_provider': 'openrouter',
-}
+})
 
 # Application settings
 APP_TITLE = "Investment Recommendation Generator"
@@ -42,8 +45,12 @@ MAX_PRICE = 1000000.0
 
 # Image settings
 MAX_IMAGE_SIZE = 10 * 1024 * 1024  # 10MB
-SUPPORTED_IMAGE_FORMATS: List[str] = ['png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp']
-LATEX_SUPPORTED_FORMATS: List[str] = ['png', 'jpg', 'jpeg', 'pdf', 'eps']
+SUPPORTED_IMAGE_FORMATS: Tuple[str, ...] = ('png', 'jpg', 'jpeg', 'gif', 'bmp', 'tiff', 'webp')
+LATEX_SUPPORTED_FORMATS: Tuple[str, ...] = ('png', 'jpg', 'jpeg', 'pdf', 'eps')
+
+# Set views for membership checks
+SUPPORTED_IMAGE_FORMATS_SET: FrozenSet[str] = frozenset(SUPPORTED_IMAGE_FORMATS)
+LATEX_SUPPORTED_FORMATS_SET: FrozenSet[str] = frozenset(LATEX_SUPPORTED_FORMATS)
 
 # UI Constants
 DEFAULT_FORM_CATEGORY = "ASX Alpha"
@@ -53,21 +60,21 @@ DEFAULT_TARGET_PRICE = 0.01
 DEFAULT_STOP_LOSS = 0.01
 
 # Template settings
-TEMPLATE_VERSIONS = ["v1", "v2", "v3"]
-TEMPLATE_PREVIEW_IMAGES = {
+TEMPLATE_VERSIONS = ("v1", "v2", "v3")
+TEMPLATE_PREVIEW_IMAGES = MappingProxyType({
     "v1": "v1_preview.png",
     "v2": "v2_preview.png", 
     "v3": "v3_preview.png"
-}
+})
 
 # CSS Constants
-CSS_FONT_FAMILIES = {
+CSS_FONT_FAMILIES = MappingProxyType({
     'inter': 'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap',
     'poppins': 'https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700;800&display=swap'
-}
+})
 
 # Color scheme
-COLORS = {
+COLORS = MappingProxyType({
     'primary': '#2c3e50',
     'secondary': '#3498db',
     'success': '#27ae60',
@@ -78,31 +85,35 @@ COLORS = {
     'dark': '#2c3e50',
     'white': '#ffffff',
     'gray': '#6c757d'
-}
+})
 
 # Analysis types
-ANALYSIS_TYPES = [
+ANALYSIS_TYPES = (
     "Fundamentals",
     "Technical Analysis", 
     "Macro/Geopolitical",
     "Catalyst"
-]
+)
 
 # Content source types
-CONTENT_SOURCES = ["human", "ai"]
+CONTENT_SOURCES = ("human", "ai")
+
+# Lowercased action names grouped by the price fields they use
+BUY_OR_ADD_ACTIONS: FrozenSet[str] = frozenset({'buy', 'add', 'switch'})
+SELL_OR_TAKE_PROFIT_ACTIONS: FrozenSet[str] = frozenset({'sell', 'take profit'})
 
 # Error messages
-ERROR_MESSAGES = {
-    'company_name_required': "Company name is required",
-    'ticker_required': "Ticker is required",
-    'analysis_type_required': "At least one analysis type must be selected",
-    'executive_summary_required': "Executive summary is required for human-written content",
-    'investment_rationale_required': "Investment rationale is required for human-written content",
-    'ai_rationale_required': "Investment rationale context is required for AI generation",
-    'ticker_format_invalid': "Ticker should contain only letters, numbers, dots, and hyphens",
-    'company_name_too_short': "Company name should be at least 2 characters long",
-    'latex_not_available': "LaTeX is not available on this system. Please install LaTeX to generate PDF reports.",
-    'pdf_generation_failed': "Failed to generate PDF report. Please check the logs for details.",
-    'image_upload_failed': "Failed to upload image. Please try again.",
-    'ai_generation_failed': "Failed to generate AI content. Please try again."
-}
+class ErrorMessage(StrEnum):
+    """User-facing error messages"""
+    COMPANY_NAME_REQUIRED = "Company name is required"
+    TICKER_REQUIRED = "Ticker is required"
+    ANALYSIS_TYPE_REQUIRED = "At least one analysis type must be selected"
+    EXECUTIVE_SUMMARY_REQUIRED = "Executive summary is required for human-written content"
+    INVESTMENT_RATIONALE_REQUIRED = "Investment rationale is required for human-written content"
+    AI_RATIONALE_REQUIRED = "Investment rationale context is required for AI generation"
+    TICKER_FORMAT_INVALID = "Ticker should contain only letters, numbers, dots, and hyphens"
+    COMPANY_NAME_TOO_SHORT = "Company name should be at least 2 characters long"
+    LATEX_NOT_AVAILABLE = "LaTeX is not available on this system. Please install LaTeX to generate PDF reports."
+    PDF_GENERATION_FAILED = "Failed to generate PDF report. Please check the logs for details."
+    IMAGE_UPLOAD_FAILED = "Failed to upload image. Please try again."
+    AI_GENERATION_FAILED = "Failed to generate AI content. Please try again."
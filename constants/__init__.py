@@ -3,6 +3,6 @@
 Constants package for the Investment Recommendation Generator
 """
 
-from .css_constants import MAIN_CSS, SIDEBAR_CSS
+from .css_constants import get_main_css, get_sidebar_css
 
-__all__ = ['MAIN_CSS', 'SIDEBAR_CSS']
+__all__ = ['get_main_css', 'get_sidebar_css']
@@ -4,10 +4,30 @@ CSS constants and styling for the Investment Recommendation Generator
 Centralized CSS for maintainability and consistency
 """
 
+import functools
+import os
+import re
+
 from config import CSS_FONT_FAMILIES, COLORS
 
+# Set CSS_DEBUG to ship the readable stylesheets instead of the minified ones
+CSS_DEBUG = bool(os.environ.get('CSS_DEBUG'))
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace from a <style> block"""
+    if CSS_DEBUG:
+        return css
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{}:;,>])\s*', r'\1', css).strip()
+
+
 # Main CSS styles
-MAIN_CSS = f"""
+@functools.cache
+def get_main_css() -> str:
+    """Build the minified main stylesheet on first use"""
+    return _minify_css(f"""
 <style>
     /* Import Google Fonts */
     @import url('{CSS_FONT_FAMILIES['inter']}');
@@ -238,10 +258,13 @@ MAIN_CSS = f"""
         }}
     }}
 </style>
-"""
+""")
 
 # Sidebar CSS
-SIDEBAR_CSS = f"""
+@functools.cache
+def get_sidebar_css() -> str:
+    """Build the minified sidebar stylesheet on first use"""
+    return _minify_css(f"""
 <style>
     .css-1d391kg {{
         background-color: {COLORS['dark']};
@@ -279,4 +302,4 @@ SIDEBAR_CSS = f"""
         border-color: {COLORS['secondary']};
     }}
 </style>
-"""
+""")
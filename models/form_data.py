@@ -3,17 +3,23 @@
 Form data models and validation for the Investment Recommendation Generator
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Union
+import re
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Tuple, Union
 from enum import Enum
 import streamlit as st
 from config import (
     DEFAULT_FORM_CATEGORY, DEFAULT_FORM_ACTION, 
     DEFAULT_ENTRY_PRICE, DEFAULT_TARGET_PRICE, DEFAULT_STOP_LOSS,
-    ERROR_MESSAGES
+    BUY_OR_ADD_ACTIONS, SELL_OR_TAKE_PROFIT_ACTIONS, ErrorMessage
 )
 
 
+# Letters and digits, optionally mixed with dots and hyphens (at least one alphanumeric)
+_TICKER_RE = re.compile(r'[.\-]*(?:[^\W_][.\-]*)+')
+
+
 class AnalysisType(Enum):
     """Analysis types for investment recommendations"""
     FUNDAMENTALS = "Fundamentals"
@@ -35,7 +41,24 @@ class TemplateVersion(Enum):
     V3 = "v3"
 
 
-@dataclass
+# Key layout of FormData.to_dict(); copying a presized dict beats growing a literal
+_TO_DICT_TEMPLATE: Dict[str, Any] = dict.fromkeys((
+    'category', 'action', 'ticker', 'company_name', 'subtitle', 'analysis_types',
+    'entry_price', 'target_price', 'stop_loss', 'exit_price', 'content_source',
+    'human_executive_summary', 'human_investment_rationale', 'ai_rationale',
+    'ai_context', 'ai_executive_summary', 'ai_investment_rationale',
+    'ai_executive_summary_markdown', 'ai_investment_rationale_markdown',
+    'company_logo_filename', 'chart_image_filename', 'template_version', 'timestamp',
+))
+
+# Value -> member maps for from_dict; the constructors stay as the fallback
+# so unknown values still raise ValueError
+_ANALYSIS_TYPES_BY_VALUE = AnalysisType._value2member_map_
+_CONTENT_SOURCES_BY_VALUE = ContentSource._value2member_map_
+_TEMPLATE_VERSIONS_BY_VALUE = TemplateVersion._value2member_map_
+
+
+@dataclass(slots=True)
 class FormData:
     """
     Investment recommendation form data model.
@@ -51,7 +74,8 @@ class FormData:
     subtitle: str = ""
     
     # Analysis
-    analysis_types: List[AnalysisType] = field(default_factory=list)
+    # Empty tuple default so blank instances share it; callers assign new lists, never mutate in place
+    analysis_types: Union[List[AnalysisType], Tuple[AnalysisType, ...]] = ()
     
     # Trade Plan - Different fields based on action type
     # For Buy/Add: entry_price, target_price, stop_loss
@@ -74,8 +98,6 @@ class FormData:
     ai_investment_rationale_markdown: str = ""
     
     # Images
-    company_logo: Optional[Any] = None  # Streamlit UploadedFile
-    chart_image: Optional[Any] = None   # Streamlit UploadedFile
     company_logo_filename: Optional[str] = None
     chart_image_filename: Optional[str] = None
     
@@ -85,49 +107,57 @@ class FormData:
     # Metadata
     timestamp: str = ""
     
+    def __post_init__(self):
+        """Intern the short, frequently repeated string fields"""
+        self.category = sys.intern(self.category)
+        self.action = sys.intern(self.action)
+        self.ticker = sys.intern(self.ticker)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for processing"""
-        return {
-            'category': self.category,
-            'action': self.action,
-            'ticker': self.ticker,
-            'company_name': self.company_name,
-            'subtitle': self.subtitle,
-            'analysis_types': [at if isinstance(at, str) else at.value for at in self.analysis_types],
-            'entry_price': self.entry_price,
-            'target_price': self.target_price,
-            'stop_loss': self.stop_loss,
-            'exit_price': self.exit_price,
-            'content_source': self.content_source.value if hasattr(self.content_source, 'value') else str(self.content_source),
-            'human_executive_summary': self.human_executive_summary,
-            'human_investment_rationale': self.human_investment_rationale,
-            'ai_rationale': self.ai_rationale,
-            'ai_context': self.ai_context,
-            'ai_executive_summary': self.ai_executive_summary,
-            'ai_investment_rationale': self.ai_investment_rationale,
-            'ai_executive_summary_markdown': self.ai_executive_summary_markdown,
-            'ai_investment_rationale_markdown': self.ai_investment_rationale_markdown,
-            'company_logo_filename': self.company_logo_filename,
-            'chart_image_filename': self.chart_image_filename,
-            'template_version': self.template_version.value if hasattr(self.template_version, 'value') else str(self.template_version),
-            'timestamp': self.timestamp
-        }
+        data = _TO_DICT_TEMPLATE.copy()
+        data['category'] = self.category
+        data['action'] = self.action
+        data['ticker'] = self.ticker
+        data['company_name'] = self.company_name
+        data['subtitle'] = self.subtitle
+        data['analysis_types'] = [at.value if at.__class__ is AnalysisType else at for at in self.analysis_types]
+        data['entry_price'] = self.entry_price
+        data['target_price'] = self.target_price
+        data['stop_loss'] = self.stop_loss
+        data['exit_price'] = self.exit_price
+        data['content_source'] = self.content_source.value if self.content_source.__class__ is ContentSource else str(self.content_source)
+        data['human_executive_summary'] = self.human_executive_summary
+        data['human_investment_rationale'] = self.human_investment_rationale
+        data['ai_rationale'] = self.ai_rationale
+        data['ai_context'] = self.ai_context
+        data['ai_executive_summary'] = self.ai_executive_summary
+        data['ai_investment_rationale'] = self.ai_investment_rationale
+        data['ai_executive_summary_markdown'] = self.ai_executive_summary_markdown
+        data['ai_investment_rationale_markdown'] = self.ai_investment_rationale_markdown
+        data['company_logo_filename'] = self.company_logo_filename
+        data['chart_image_filename'] = self.chart_image_filename
+        data['template_version'] = self.template_version.value if self.template_version.__class__ is TemplateVersion else str(self.template_version)
+        data['timestamp'] = self.timestamp
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FormData':
         """Create from dictionary"""
+        content_source = data.get('content_source', 'human')
+        template_version = data.get('template_version', 'v2')
         return cls(
             category=data.get('category', 'ASX Alpha'),
             action=data.get('action', 'Buy'),
             ticker=data.get('ticker', ''),
             company_name=data.get('company_name', ''),
             subtitle=data.get('subtitle', ''),
-            analysis_types=[AnalysisType(at) for at in data.get('analysis_types', [])],
+            analysis_types=[_ANALYSIS_TYPES_BY_VALUE.get(at) or AnalysisType(at) for at in data.get('analysis_types', ())],
             entry_price=data.get('entry_price', 0.0),
             target_price=data.get('target_price', 0.0),
             stop_loss=data.get('stop_loss', 0.0),
             exit_price=data.get('exit_price', 0.0),
-            content_source=ContentSource(data.get('content_source', 'human')),
+            content_source=_CONTENT_SOURCES_BY_VALUE.get(content_source) or ContentSource(content_source),
             human_executive_summary=data.get('human_executive_summary', ''),
             human_investment_rationale=data.get('human_investment_rationale', ''),
             ai_rationale=data.get('ai_rationale', ''),
@@ -138,7 +168,7 @@ class FormData:
             ai_investment_rationale_markdown=data.get('ai_investment_rationale_markdown', ''),
             company_logo_filename=data.get('company_logo_filename'),
             chart_image_filename=data.get('chart_image_filename'),
-            template_version=TemplateVersion(data.get('template_version', 'v2')),
+            template_version=_TEMPLATE_VERSIONS_BY_VALUE.get(template_version) or TemplateVersion(template_version),
             timestamp=data.get('timestamp', '')
         )
     
@@ -152,69 +182,35 @@ class FormData:
         errors = []
         
         # Required fields validation
-        errors.extend(self._validate_required_fields())
-        
-        # Content validation based on source
-        errors.extend(self._validate_content())
-        
-        # Price validation
-        errors.extend(self._validate_prices())
-        
-        # Business rule validation
-        errors.extend(self._validate_business_rules())
-        
-        return errors
-    
-    def _validate_required_fields(self) -> List[str]:
-        """Validate required fields."""
-        errors = []
-        
         if not self.company_name.strip():
-            errors.append(ERROR_MESSAGES['company_name_required'])
+            errors.append(ErrorMessage.COMPANY_NAME_REQUIRED)
         
         if not self.ticker.strip():
-            errors.append(ERROR_MESSAGES['ticker_required'])
+            errors.append(ErrorMessage.TICKER_REQUIRED)
         
         if not self.analysis_types:
-            errors.append(ERROR_MESSAGES['analysis_type_required'])
-        
-        return errors
-    
-    def _validate_content(self) -> List[str]:
-        """Validate content based on source."""
-        errors = []
+            errors.append(ErrorMessage.ANALYSIS_TYPE_REQUIRED)
         
-        if self.content_source == ContentSource.HUMAN:
+        # Content validation based on source
+        if self.content_source is ContentSource.HUMAN:
             if not self.human_executive_summary.strip():
-                errors.append(ERROR_MESSAGES['executive_summary_required'])
+                errors.append(ErrorMessage.EXECUTIVE_SUMMARY_REQUIRED)
             if not self.human_investment_rationale.strip():
-                errors.append(ERROR_MESSAGES['investment_rationale_required'])
-        elif self.content_source == ContentSource.AI:
+                errors.append(ErrorMessage.INVESTMENT_RATIONALE_REQUIRED)
+        elif self.content_source is ContentSource.AI:
             if not self.ai_rationale.strip():
-                errors.append(ERROR_MESSAGES['ai_rationale_required'])
-        
-        return errors
-    
-    def _validate_prices(self) -> List[str]:
-        """Validate price fields."""
-        errors = []
+                errors.append(ErrorMessage.AI_RATIONALE_REQUIRED)
         
         # Price validation is optional - no validation needed
-        # This method is kept for future extensibility
-        
-        return errors
-    
-    def _validate_business_rules(self) -> List[str]:
-        """Validate business rules."""
-        errors = []
         
+        # Business rule validation
         # Validate ticker format (basic check)
-        if self.ticker and not self.ticker.replace('.', '').replace('-', '').isalnum():
-            errors.append(ERROR_MESSAGES['ticker_format_invalid'])
+        if self.ticker and not _TICKER_RE.fullmatch(self.ticker):
+            errors.append(ErrorMessage.TICKER_FORMAT_INVALID)
         
         # Validate company name length
         if self.company_name and len(self.company_name.strip()) < 2:
-            errors.append(ERROR_MESSAGES['company_name_too_short'])
+            errors.append(ErrorMessage.COMPANY_NAME_TOO_SHORT)
         
         return errors
     
@@ -225,7 +221,7 @@ class FormData:
         Returns:
             str: Executive summary content from the active content source.
         """
-        if self.content_source == ContentSource.AI:
+        if self.content_source is ContentSource.AI:
             return self.ai_executive_summary
         return self.human_executive_summary
     
@@ -236,7 +232,7 @@ class FormData:
         Returns:
             str: Investment rationale content from the active content source.
         """
-        if self.content_source == ContentSource.AI:
+        if self.content_source is ContentSource.AI:
             return self.ai_investment_rationale
         return self.human_investment_rationale
     
@@ -249,7 +245,7 @@ class FormData:
         Returns:
             str: Executive summary content optimized for PDF generation.
         """
-        if self.content_source == ContentSource.AI:
+        if self.content_source is ContentSource.AI:
             return self.ai_executive_summary_markdown if self.ai_executive_summary_markdown else self.ai_executive_summary
         return self.human_executive_summary
     
@@ -262,7 +258,7 @@ class FormData:
         Returns:
             str: Investment rationale content optimized for PDF generation.
         """
-        if self.content_source == ContentSource.AI:
+        if self.content_source is ContentSource.AI:
             return self.ai_investment_rationale_markdown if self.ai_investment_rationale_markdown else self.ai_investment_rationale
         return self.human_investment_rationale
     
@@ -273,7 +269,7 @@ class FormData:
         Returns:
             bool: True if action is Buy, Add, or Switch, False otherwise.
         """
-        return self.action.lower() in ['buy', 'add', 'switch']
+        return self.action.lower() in BUY_OR_ADD_ACTIONS
     
     def is_sell_or_take_profit_action(self) -> bool:
         """
@@ -282,7 +278,7 @@ class FormData:
         Returns:
             bool: True if action is Sell or Take Profit, False otherwise.
         """
-        return self.action.lower() in ['sell', 'take profit']
+        return self.action.lower() in SELL_OR_TAKE_PROFIT_ACTIONS
     
     def get_primary_price(self) -> float:
         """
@@ -3,14 +3,22 @@
 Report data model for PDF generation
 """
 
+import functools
+import sys
 from dataclasses import dataclass
 from typing import List, Optional
-from datetime import datetime
+from datetime import date
 
 from .form_data import FormData
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _format_report_date(day: date) -> str:
+    """Format the report date once per calendar day"""
+    return day.strftime('%d-%m-%Y')
+
+
+@dataclass(slots=True)
 class ReportData:
     """Data structure for report generation"""
     # Basic Information
@@ -66,12 +74,12 @@ class ReportData:
             target_price=f"{form_data.target_price:.2f}",
             stop_loss=f"{form_data.stop_loss:.2f}",
             exit_price=f"{form_data.exit_price:.2f}",
-            analysis_types=[at if isinstance(at, str) else at.value for at in form_data.analysis_types],
+            analysis_types=[sys.intern(at if isinstance(at, str) else at.value) for at in form_data.analysis_types],
             investment_thesis=form_data.get_executive_summary_for_pdf(),
             rationale=form_data.get_investment_rationale_for_pdf(),
             company_logo_filename=form_data.company_logo_filename,
             chart_image_filename=form_data.chart_image_filename,
-            report_date=datetime.now().strftime('%d-%m-%Y'),
+            report_date=_format_report_date(date.today()),
             risk_level="Medium",  # Default risk level
             potential_return="N/A",  # No risk metrics calculation
             risk_amount="N/A"  # No risk metrics calculation
@@ -4,6 +4,11 @@ Simplified prompt templates for investment recommendation report generation usin
 Based on the original simple and effective approach.
 """
 
+import functools
+import string
+
+from config import BUY_OR_ADD_ACTIONS
+
 # Investment Thesis Prompt Template
 INVESTMENT_THESIS_PROMPT = """
 You are a senior investment analyst at MPC Markets writing an investment thesis for professional investors. Your goal is to articulate MPC Markets' core investment argument with clarity and conviction.
@@ -107,39 +112,58 @@ Paragraph 5: Risk Considerations - Key risks, mitigation factors, risk-reward pr
 **OUTPUT**: Write only the investment rationale text with exactly 4-5 paragraphs separated by blank lines, no additional formatting or explanations.
 """
 
+def _compile_template(template):
+    """Split a str.format template into (literal, field_name) pairs once at import."""
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    )
+
+def _render_template(parts, values):
+    """Render a compiled template; same output as template.format(**values)."""
+    return "".join([
+        literal + str(values[field_name]) if field_name is not None else literal
+        for literal, field_name in parts
+    ])
+
+_INVESTMENT_THESIS_PARTS = _compile_template(INVESTMENT_THESIS_PROMPT)
+_ANALYSIS_PARTS = _compile_template(ANALYSIS_PROMPT)
+
+@functools.lru_cache(maxsize=128)
+def _join_analysis_types(analysis_types):
+    """Join a tuple of analysis types for the prompt, cached per combination."""
+    return ', '.join(analysis_types) if analysis_types else 'None specified'
+
+_BUY_PRICE_FIELDS = "- Entry Price: {}\n- Target Price: {}\n- Stop Loss: {}".format
+_SELL_PRICE_FIELDS = "- Exit Price: {}".format
+
 def _format_price_fields(action, entry_price, target_price, stop_loss, exit_price):
     """Format price fields based on action type."""
-    action_lower = action.lower()
-    
-    if action_lower in ['buy', 'add', 'switch']:
-        return f"""- Entry Price: {entry_price}
-- Target Price: {target_price}
-- Stop Loss: {stop_loss}"""
-    else:  # sell, take profit
-        return f"- Exit Price: {exit_price}"
+    if action.lower() in BUY_OR_ADD_ACTIONS:
+        return _BUY_PRICE_FIELDS(entry_price, target_price, stop_loss)
+    return _SELL_PRICE_FIELDS(exit_price)  # sell, take profit
 
-def format_investment_thesis_prompt(ticker, action, entry_price, target_price, stop_loss, analysis_types, investment_rationale, context, exit_price=0.0):
-    """Format the investment summary prompt with provided data."""
-    price_fields = _format_price_fields(action, entry_price, target_price, stop_loss, exit_price)
-    
-    return INVESTMENT_THESIS_PROMPT.format(
+def _prompt_values(ticker, action, entry_price, target_price, stop_loss, analysis_types, investment_rationale, context, exit_price):
+    """Build the template values shared by both prompts."""
+    return dict(
         ticker=ticker,
         action=action,
-        price_fields=price_fields,
-        analysis_types=', '.join(analysis_types) if analysis_types else 'None specified',
+        price_fields=_format_price_fields(action, entry_price, target_price, stop_loss, exit_price),
+        analysis_types=_join_analysis_types(analysis_types),
         investment_rationale=investment_rationale or 'No specific rationale provided',
         context=context or 'No additional context provided'
     )
 
+def format_investment_thesis_prompt(ticker, action, entry_price, target_price, stop_loss, analysis_types, investment_rationale, context, exit_price=0.0):
+    """Format the investment summary prompt with provided data."""
+    return _render_template(_INVESTMENT_THESIS_PARTS, _prompt_values(
+        ticker, action, entry_price, target_price, stop_loss,
+        tuple(analysis_types or ()), investment_rationale, context, exit_price
+    ))
+
 def format_analysis_prompt(ticker, action, entry_price, target_price, stop_loss, analysis_types, investment_rationale, context, exit_price=0.0):
     """Format the investment rationale prompt with provided data."""
-    price_fields = _format_price_fields(action, entry_price, target_price, stop_loss, exit_price)
-    
-    return ANALYSIS_PROMPT.format(
-        ticker=ticker,
-        action=action,
-        price_fields=price_fields,
-        analysis_types=', '.join(analysis_types) if analysis_types else 'None specified',
-        investment_rationale=investment_rationale or 'No specific rationale provided',
-        context=context or 'No additional context provided'
-    )
+    return _render_template(_ANALYSIS_PARTS, _prompt_values(
+        ticker, action, entry_price, target_price, stop_loss,
+        tuple(analysis_types or ()), investment_rationale, context, exit_price
+    ))
@@ -1,13 +1,33 @@
 #!/usr/bin/env python3
 """
 Services for Investment Recommendation Generator v2
+
+Services are imported lazily on first attribute access (PEP 562) so that
+importing one service module does not pull in the others.
 """
 
-from .ai_service import AIService
-from .openrouter_ai_service import OpenRouterAIService
-from .image_service import ImageService
-from .pdf_service import PDFService
+from importlib import import_module
+
+# Public service name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'AIService': '.ai_service',
+    'OpenRouterAIService': '.openrouter_ai_service',
+    'ImageService': '.image_service',
+    'PDFService': '.pdf_service',
+}
 
 __all__ = [
     'AIService', 'OpenRouterAIService', 'ImageService', 'PDFService'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -3,12 +3,16 @@
 Image service for handling image uploads and processing
 """
 
+import hashlib
 import io
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import streamlit as st
 from PIL import Image
 
-from config import IMAGES_DIR, MAX_IMAGE_SIZE, SUPPORTED_IMAGE_FORMATS, LATEX_SUPPORTED_FORMATS
+from config import (
+    IMAGES_DIR, MAX_IMAGE_SIZE, SUPPORTED_IMAGE_FORMATS,
+    SUPPORTED_IMAGE_FORMATS_SET, LATEX_SUPPORTED_FORMATS_SET
+)
 
 
 class ImageService:
@@ -17,6 +21,8 @@ class ImageService:
     def __init__(self):
         self.images_dir = IMAGES_DIR
         self.images_dir.mkdir(parents=True, exist_ok=True)
+        # Saved filenames keyed by (filename_prefix, content digest)
+        self._saved_uploads: Dict[Tuple[str, str], str] = {}
     
     def save_uploaded_image(self, uploaded_file, filename_prefix: str) -> Optional[str]:
         """
@@ -40,6 +46,13 @@ class ImageService:
             
             # Read file content
             file_content = uploaded_file.read()
+            uploaded_file.seek(0)  # Reset file pointer for later use (e.g. previews)
+            
+            # Reuse the previously saved file for an identical upload
+            cache_key = (filename_prefix, hashlib.sha256(file_content).hexdigest())
+            cached_filename = self._saved_uploads.get(cache_key)
+            if cached_filename and (self.images_dir / cached_filename).exists():
+                return cached_filename
             
             # Get original extension
             original_name = uploaded_file.name
@@ -49,7 +62,7 @@ class ImageService:
                 original_ext = 'png'
             
             # Convert unsupported formats to PNG
-            if original_ext not in LATEX_SUPPORTED_FORMATS:
+            if original_ext not in LATEX_SUPPORTED_FORMATS_SET:
                 file_content, original_ext = self._convert_image_format(file_content, original_ext)
                 if file_content is None:
                     return None
@@ -64,6 +77,7 @@ class ImageService:
             with open(file_path, 'wb') as f:
                 f.write(file_content)
             
+            self._saved_uploads[cache_key] = filename
             return filename
             
         except Exception as e:
@@ -139,7 +153,7 @@ class ImageService:
         # Check file extension
         if '.' in uploaded_file.name:
             ext = uploaded_file.name.split('.')[-1].lower()
-            if ext not in SUPPORTED_IMAGE_FORMATS:
+            if ext not in SUPPORTED_IMAGE_FORMATS_SET:
                 return False, f"Unsupported image format: {ext}. Supported formats: {', '.join(SUPPORTED_IMAGE_FORMATS)}"
         
         # Try to open with PIL to validate it's a valid image
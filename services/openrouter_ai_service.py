@@ -84,12 +84,13 @@ class OpenRouterAIService:
         
         return self._openrouter_provider.get_llm(model_name=model.model_name)
     
-    def generate_content(self, form_data: FormData) -> Tuple[str, str]:
+    def generate_content(self, form_data: FormData, stream: bool = False) -> Tuple[str, str]:
         """
         Generate AI content for investment recommendation using selected model
         
         Args:
             form_data: Form data containing investment details
+            stream: Write the responses to the page as they arrive
             
         Returns:
             Tuple of (executive_summary_html, investment_rationale_html)
@@ -105,10 +106,10 @@ class OpenRouterAIService:
             llm_instance = self.get_llm_for_model(selected_model)
             
             # Generate investment summary (returns markdown)
-            executive_summary_markdown = self._generate_investment_thesis(form_data, llm_instance)
+            executive_summary_markdown = self._generate_investment_thesis(form_data, llm_instance, stream)
             
             # Generate investment rationale (returns markdown)
-            investment_rationale_markdown = self._generate_analysis(form_data, llm_instance)
+            investment_rationale_markdown = self._generate_analysis(form_data, llm_instance, stream)
             
             # Store original Markdown content for PDF generation
             form_data.ai_executive_summary_markdown = executive_summary_markdown
@@ -127,7 +128,7 @@ class OpenRouterAIService:
         except Exception as e:
             raise Exception(f"AI content generation failed: {e}")
     
-    def _generate_investment_thesis(self, form_data: FormData, llm_instance) -> str:
+    def _generate_investment_thesis(self, form_data: FormData, llm_instance, stream: bool = False) -> str:
         """Generate investment summary using AI (returns raw markdown)"""
         try:
             from prompts import format_investment_thesis_prompt
@@ -144,8 +145,7 @@ class OpenRouterAIService:
                 exit_price=form_data.exit_price
             )
             
-            response = llm_instance.invoke(prompt)
-            raw_content = response.content if hasattr(response, 'content') else str(response)
+            raw_content = self._invoke_llm(llm_instance, prompt, stream)
             
             # Return raw markdown content (don't format here)
             return self._normalize_encoding(raw_content)
@@ -154,7 +154,7 @@ class OpenRouterAIService:
             st.warning(f"AI thesis generation failed: {e}")
             return self._generate_fallback_thesis(form_data)
     
-    def _generate_analysis(self, form_data: FormData, llm_instance) -> str:
+    def _generate_analysis(self, form_data: FormData, llm_instance, stream: bool = False) -> str:
         """Generate investment rationale using AI (returns raw markdown)"""
         try:
             from prompts import format_analysis_prompt
@@ -171,8 +171,7 @@ class OpenRouterAIService:
                 exit_price=form_data.exit_price
             )
             
-            response = llm_instance.invoke(prompt)
-            raw_content = response.content if hasattr(response, 'content') else str(response)
+            raw_content = self._invoke_llm(llm_instance, prompt, stream)
             
             # Return raw markdown content (don't format here)
             return self._normalize_encoding(raw_content)
@@ -181,6 +180,22 @@ class OpenRouterAIService:
             st.warning(f"AI analysis generation failed: {e}")
             return self._generate_fallback_analysis(form_data)
     
+    def _invoke_llm(self, llm_instance, prompt: str, stream: bool = False) -> str:
+        """Get the raw LLM response text, optionally streaming it to the page"""
+        if stream and hasattr(llm_instance, 'stream'):
+            return st.write_stream(self._stream_llm_text(llm_instance, prompt))
+        
+        response = llm_instance.invoke(prompt)
+        return response.content if hasattr(response, 'content') else str(response)
+    
+    @staticmethod
+    def _stream_llm_text(llm_instance, prompt: str):
+        """Yield the text of each LLM response chunk as it arrives"""
+        for chunk in llm_instance.stream(prompt):
+            text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+            if text:
+                yield text
+    
     def _generate_fallback_thesis(self, form_data: FormData) -> str:
         """Generate fallback investment thesis in simple format"""
         analysis_types_str = ', '.join(form_data.analysis_types)
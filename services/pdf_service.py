@@ -11,7 +11,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Tuple
 
-from config import TEMPLATES_DIR, TEMP_DIR, IMAGES_DIR, PDFS_DIR, LOGS_DIR
+from config import TEMPLATES_DIR, TEMP_DIR, IMAGES_DIR, PDFS_DIR, LOGS_DIR, BUY_OR_ADD_ACTIONS
 from models.report_data import ReportData
 from models.form_data import FormData
 
@@ -169,7 +169,7 @@ class PDFService:
         template_content = template_content.replace('ACTIONBOXPLACEHOLDER', action_box)
         
         # Price fields - handle dynamically based on action type
-        if report_data.action.lower() in ['buy', 'add', 'switch']:
+        if report_data.action.lower() in BUY_OR_ADD_ACTIONS:
             # For Buy/Add actions, show entry, target, stop loss
             template_content = template_content.replace('ENTRYPRICELABELPLACEHOLDER', 'Entry Price:')
             template_content = template_content.replace('TARGETPRICELABELPLACEHOLDER', 'Target Price:')
@@ -15,7 +15,7 @@ import io
 
 from config import (
     DATA_DIR, PDFS_DIR, LOGS_DIR, TEMP_DIR, IMAGES_DIR, TEMPLATES_DIR,
-    LOGO_PATH, MAX_IMAGE_SIZE, SUPPORTED_IMAGE_FORMATS, LATEX_SUPPORTED_FORMATS
+    LOGO_PATH, MAX_IMAGE_SIZE, SUPPORTED_IMAGE_FORMATS, LATEX_SUPPORTED_FORMATS_SET
 )
 
 
@@ -62,7 +62,7 @@ def save_uploaded_image(uploaded_file, filename_prefix: str) -> Optional[str]:
             original_ext = 'png'
         
         # Convert unsupported formats to PNG
-        if original_ext not in LATEX_SUPPORTED_FORMATS:
+        if original_ext not in LATEX_SUPPORTED_FORMATS_SET:
             try:
                 # Open and convert image
                 image = Image.open(io.BytesIO(file_content))